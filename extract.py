@@ -14,42 +14,58 @@ Usage:
 """
 
 import argparse
+import atexit
+import gzip
+import hashlib
 import json
+import string
 import sys
+import threading
+from collections import ChainMap, OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+try:
+    # Optional faster JSON serializer (pip install genealogy-extractors[fast])
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src to path for package imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Import all extractors
-from genealogy_extractors.extractors import (
-    FindAGraveExtractor,
-    AntenatiExtractor,
-    GeneanetExtractor,
-    WikiTreeExtractor,
-    FamilySearchExtractor,
-    AncestryExtractor,
-    MyHeritageExtractor,
-    FreeBMDExtractor,
-    FilaeExtractor,
-    GeniExtractor,
-    MatchIDExtractor,
-    BillionGravesExtractor,
-    DigitalarkivetExtractor,
-    IrishGenealogyExtractor,
-    MatriculaExtractor,
-    ScotlandsPeopleExtractor,
-    ANOMExtractor,
-)
+# Extractor classes are resolved lazily by name (see get_extractor)
+from genealogy_extractors import extractors
 
 # Import CDP client for production fetching
-from genealogy_extractors.cdp_client import fetch_page_content, BotCheckDetected, DailyLimitReached
+from genealogy_extractors.cdp_client import fetch_page_content, browser_slot, PlaywrightSession, BotCheckDetected, DailyLimitReached
 from genealogy_extractors.rate_limiter import get_rate_limiter
-from genealogy_extractors.error_tracker import log_error
-from genealogy_extractors.debug_log import debug, info, warn, error, set_verbose, is_verbose
+from genealogy_extractors.error_tracker import classify_error, log_error
+from genealogy_extractors.daily_limits import daily_limit_reached, mark_daily_limit
+from genealogy_extractors.debug_log import debug, info, info_block, warn, error, set_verbose, is_verbose
 from genealogy_extractors.location_resolver import build_filae_url
-import requests
+from genealogy_extractors.response_cache import DEFAULT_TTL, cache_key, get_response_cache
+
+
+class SourceCfg(NamedTuple):
+    """Static configuration for one searchable source."""
+    name: str
+    extractor_name: str
+    url_template: Optional[str]
+    test_fixture: str
+    test_params: dict
+    url_template_with_location: Optional[str] = None
+    wait_for_selector: Optional[str] = None
+    location_filter_works: bool = False
+    use_location_resolver: bool = False
+    cache_ttl: int = DEFAULT_TTL
+    # Text that first appears in the first result; page content before the tag
+    # holding it is dropped ahead of extraction (see trim_to_results)
+    result_marker: Optional[str] = None
 
 
 # Source configuration
@@ -58,222 +74,365 @@ import requests
 #   - Use {location} placeholder in url_template_with_location
 # location_filter_works: True if location filtering actually filters results server-side
 SOURCES = {
-    'findagrave': {
-        'name': 'Find A Grave',
-        'extractor': FindAGraveExtractor(),
-        'url_template': 'https://www.findagrave.com/memorial/search?firstname={given_name}&lastname={surname}&birthyear={birth_year}&birthyearfilter=5',
-        'test_fixture': 'tests/fixtures/findagrave_johnson_mary.html',
-        'test_params': {'surname': 'Johnson', 'given_name': 'Mary', 'birth_year': 1870},
+    'findagrave': SourceCfg(
+        name='Find A Grave',
+        extractor_name='FindAGraveExtractor',
+        url_template='https://www.findagrave.com/memorial/search?firstname={given_name}&lastname={surname}&birthyear={birth_year}&birthyearfilter=5',
+        test_fixture='tests/fixtures/findagrave_johnson_mary.html',
+        test_params={'surname': 'Johnson', 'given_name': 'Mary', 'birth_year': 1870},
         # Find A Grave has location param but requires specific cemetery/location IDs
-        'location_filter_works': False,
-    },
-    'geneanet': {
-        'name': 'Geneanet',
-        'extractor': GeneanetExtractor(),
-        'url_template': 'https://en.geneanet.org/fonds/individus/?nom={surname}&prenom={given_name}&type_periode=birth_between&from={birth_year}&to={birth_year_end}&go=1&size=20',
-        'url_template_with_location': 'https://en.geneanet.org/fonds/individus/?nom={surname}&prenom={given_name}&type_periode=birth_between&from={birth_year}&to={birth_year_end}&go=1&size=20&place__0__={location}',
-        'test_fixture': 'tests/fixtures/geneanet_dubois_marie.html',
-        'test_params': {'surname': 'Dubois', 'given_name': 'Marie', 'birth_year': 1880},
-        'location_filter_works': True,  # Tested: 10k vs 41k results with Paris filter
-    },
-    'antenati': {
-        'name': 'Antenati',
-        'extractor': AntenatiExtractor(),
-        'url_template': 'https://antenati.cultura.gov.it/search-nominative/?cognome={surname}&nome={given_name}',
-        'test_fixture': 'tests/fixtures/antenati_milanese_nominative.html',
-        'test_params': {'surname': 'Milanese', 'given_name': 'Giovanni', 'birth_year': 1885},
+        location_filter_works=False,
+    ),
+    'geneanet': SourceCfg(
+        name='Geneanet',
+        extractor_name='GeneanetExtractor',
+        url_template='https://en.geneanet.org/fonds/individus/?nom={surname}&prenom={given_name}&type_periode=birth_between&from={birth_year}&to={birth_year_end}&go=1&size=20',
+        url_template_with_location='https://en.geneanet.org/fonds/individus/?nom={surname}&prenom={given_name}&type_periode=birth_between&from={birth_year}&to={birth_year_end}&go=1&size=20&place__0__={location}',
+        test_fixture='tests/fixtures/geneanet_dubois_marie.html',
+        test_params={'surname': 'Dubois', 'given_name': 'Marie', 'birth_year': 1880},
+        location_filter_works=True,  # Tested: 10k vs 41k results with Paris filter
+    ),
+    'antenati': SourceCfg(
+        name='Antenati',
+        extractor_name='AntenatiExtractor',
+        url_template='https://antenati.cultura.gov.it/search-nominative/?cognome={surname}&nome={given_name}',
+        test_fixture='tests/fixtures/antenati_milanese_nominative.html',
+        test_params={'surname': 'Milanese', 'given_name': 'Giovanni', 'birth_year': 1885},
         # Antenati: No location filter in URL - uses archive/fondo selection
-        'location_filter_works': False,
-    },
-    'familysearch': {
-        'name': 'FamilySearch',
-        'extractor': FamilySearchExtractor(),
-        'url_template': 'https://www.familysearch.org/en/search/record/results?q.givenName={given_name}&q.surname={surname}&q.birthLikeDate={birth_year}',
-        'url_template_with_location': 'https://www.familysearch.org/en/search/record/results?q.givenName={given_name}&q.surname={surname}&q.birthLikeDate={birth_year}&q.birthLikePlace={location}',
-        'test_fixture': 'tests/fixtures/familysearch_anderson_margaret.html',
-        'test_params': {'surname': 'Anderson', 'given_name': 'Margaret', 'birth_year': 1880},
-        'wait_for_selector': 'tr[data-testid*="/ark:/"]',  # Wait for results to load
-        'location_filter_works': True,  # Tested: 520 results with Paris,France filter
-    },
-    'wikitree': {
-        'name': 'WikiTree',
-        'extractor': WikiTreeExtractor(),
-        'url_template': None,  # Uses API
-        'test_fixture': 'tests/fixtures/wikitree_smith_john_api.json',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        location_filter_works=False,
+    ),
+    'familysearch': SourceCfg(
+        name='FamilySearch',
+        extractor_name='FamilySearchExtractor',
+        url_template='https://www.familysearch.org/en/search/record/results?q.givenName={given_name}&q.surname={surname}&q.birthLikeDate={birth_year}',
+        url_template_with_location='https://www.familysearch.org/en/search/record/results?q.givenName={given_name}&q.surname={surname}&q.birthLikeDate={birth_year}&q.birthLikePlace={location}',
+        test_fixture='tests/fixtures/familysearch_anderson_margaret.html',
+        test_params={'surname': 'Anderson', 'given_name': 'Margaret', 'birth_year': 1880},
+        wait_for_selector='tr[data-testid*="/ark:/"]',  # Wait for results to load
+        location_filter_works=True,  # Tested: 520 results with Paris,France filter
+    ),
+    'wikitree': SourceCfg(
+        name='WikiTree',
+        extractor_name='WikiTreeExtractor',
+        url_template=None,  # Uses API
+        test_fixture='tests/fixtures/wikitree_smith_john_api.json',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
         # WikiTree API has BirthLocation param but needs testing
-        'location_filter_works': False,
-    },
-    'ancestry': {
-        'name': 'Ancestry',
-        'extractor': AncestryExtractor(),
+        location_filter_works=False,
+    ),
+    'ancestry': SourceCfg(
+        name='Ancestry',
+        extractor_name='AncestryExtractor',
         # Ancestry URL format discovered via testing:
         # - name: FirstName_Surname (underscore separates, + for spaces within names)
         # - birth: YYYY (just year, not range)
         # - birth_x: ±range (e.g., 5 for ±5 years)
         # - event: _country (underscore prefix, lowercase COUNTRY name - not full location)
         # - searchMode: advanced (required for proper filtering)
-        'url_template': 'https://www.ancestry.com/search/?name={given_name}_{surname}&birth={birth_year}&birth_x=5&searchMode=advanced',
-        'url_template_with_location': 'https://www.ancestry.com/search/?name={given_name}_{surname}&birth={birth_year}&birth_x=5&event=_{country_lower}&searchMode=advanced',
-        'test_fixture': 'tests/fixtures/ancestry_smith_john.html',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
-        'location_filter_works': True,  # event=_france works for country filtering
-    },
-    'myheritage': {
-        'name': 'MyHeritage',
-        'extractor': MyHeritageExtractor(),
+        url_template='https://www.ancestry.com/search/?name={given_name}_{surname}&birth={birth_year}&birth_x=5&searchMode=advanced',
+        url_template_with_location='https://www.ancestry.com/search/?name={given_name}_{surname}&birth={birth_year}&birth_x=5&event=_{country_lower}&searchMode=advanced',
+        test_fixture='tests/fixtures/ancestry_smith_john.html',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        location_filter_works=True,  # event=_france works for country filtering
+        result_marker='global-results-card',
+    ),
+    'myheritage': SourceCfg(
+        name='MyHeritage',
+        extractor_name='MyHeritageExtractor',
         # MyHeritage URL format discovered via testing:
         # - qname: Name+fn.{FirstName}+ln.{LastName}
         # - qevents-event1: Event+et.any+ep.{Country}+epmo.similar (for country-level filtering)
         # - qevents-event1: Event+et.birth+ey.{Year}+epmo.similar (for birth year)
         # Uses {country} for broader filtering (France, Italy, etc.)
-        'url_template': 'https://www.myheritage.com/research?action=query&formId=master&formMode=1&qname=Name+fn.{given_name}+ln.{surname}&qevents-event1=Event+et.birth+ey.{birth_year}+epmo.similar&useTranslation=1',
-        'url_template_with_location': 'https://www.myheritage.com/research?action=query&formId=master&formMode=1&qname=Name+fn.{given_name}+ln.{surname}&qevents-event1=Event+et.any+ep.{country}+epmo.similar&useTranslation=1',
-        'test_fixture': 'tests/fixtures/myheritage_smith_john.html',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
-        'wait_for_selector': '.search_results_list',  # Wait for results to load
-        'location_filter_works': True,  # Tested: Results show France-related records with ep.France filter
-    },
-    'filae': {
-        'name': 'Filae',
-        'extractor': FilaeExtractor(),
-        'url_template': 'https://www.filae.com/search?ln={surname}&fn={given_name}&sy={birth_year}&ey={birth_year_end}',
-        'test_fixture': 'tests/fixtures/filae_sample.html',
-        'test_params': {'surname': 'Dubois', 'given_name': 'Marie', 'birth_year': 1875},
+        url_template='https://www.myheritage.com/research?action=query&formId=master&formMode=1&qname=Name+fn.{given_name}+ln.{surname}&qevents-event1=Event+et.birth+ey.{birth_year}+epmo.similar&useTranslation=1',
+        url_template_with_location='https://www.myheritage.com/research?action=query&formId=master&formMode=1&qname=Name+fn.{given_name}+ln.{surname}&qevents-event1=Event+et.any+ep.{country}+epmo.similar&useTranslation=1',
+        test_fixture='tests/fixtures/myheritage_smith_john.html',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        wait_for_selector='.search_results_list',  # Wait for results to load
+        location_filter_works=True,  # Tested: Results show France-related records with ep.France filter
+        result_marker='record_card',
+    ),
+    'filae': SourceCfg(
+        name='Filae',
+        extractor_name='FilaeExtractor',
+        url_template='https://www.filae.com/search?ln={surname}&fn={given_name}&sy={birth_year}&ey={birth_year_end}',
+        test_fixture='tests/fixtures/filae_sample.html',
+        test_params={'surname': 'Dubois', 'given_name': 'Marie', 'birth_year': 1875},
         # Location filtering uses build_filae_url() from location_resolver.py
         # Resolves location names to GeoNames IDs for proper Filae filtering
         # Uses static GeoNames data in data/french_locations.json (1092 locations)
-        'location_filter_works': True,
-        'use_location_resolver': True,  # Special flag to use Filae location resolver
-    },
-    'geni': {
-        'name': 'Geni',
-        'extractor': GeniExtractor(),
+        location_filter_works=True,
+        use_location_resolver=True,  # Special flag to use Filae location resolver
+    ),
+    'geni': SourceCfg(
+        name='Geni',
+        extractor_name='GeniExtractor',
         # Geni URL format discovered via testing:
         # - names: FirstName+LastName
         # - country: Country name (e.g., France, Germany, Italy) - uses {country} not {location}
         # Location filtering works with country= parameter
-        'url_template': 'https://www.geni.com/search?search_type=people&names={given_name}+{surname}',
-        'url_template_with_location': 'https://www.geni.com/search?search_type=people&names={given_name}+{surname}&country={country}',
-        'test_fixture': 'tests/fixtures/geni_sample.html',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
-        'location_filter_works': True,  # Tested: 34,522 results with country=France filter
-    },
-    'freebmd': {
-        'name': 'FreeBMD',
-        'extractor': FreeBMDExtractor(),
-        'url_template': None,  # Uses Playwright form fill
-        'test_fixture': 'tests/fixtures/freebmd_smith_john.html',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        url_template='https://www.geni.com/search?search_type=people&names={given_name}+{surname}',
+        url_template_with_location='https://www.geni.com/search?search_type=people&names={given_name}+{surname}&country={country}',
+        test_fixture='tests/fixtures/geni_sample.html',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        location_filter_works=True,  # Tested: 34,522 results with country=France filter
+    ),
+    'freebmd': SourceCfg(
+        name='FreeBMD',
+        extractor_name='FreeBMDExtractor',
+        url_template=None,  # Uses Playwright form fill
+        test_fixture='tests/fixtures/freebmd_smith_john.html',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
         # FreeBMD is UK-only, no location filter needed
-        'location_filter_works': False,
-    },
+        location_filter_works=False,
+    ),
     # === NEW SOURCES ===
-    'matchid': {
-        'name': 'MatchID',
-        'extractor': MatchIDExtractor(),
-        'url_template': None,  # Uses API
-        'test_fixture': 'tests/fixtures/matchid_sample.json',
-        'test_params': {'surname': 'Dupont', 'given_name': 'Marie', 'birth_year': 1920},
+    'matchid': SourceCfg(
+        name='MatchID',
+        extractor_name='MatchIDExtractor',
+        url_template=None,  # Uses API
+        test_fixture='tests/fixtures/matchid_sample.json',
+        test_params={'surname': 'Dupont', 'given_name': 'Marie', 'birth_year': 1920},
         # MatchID API has birthPlace filter - needs testing
-        'location_filter_works': False,
-    },
-    'billiongraves': {
-        'name': 'BillionGraves',
-        'extractor': BillionGravesExtractor(),
-        'url_template': 'https://billiongraves.com/site/search/results?given_names={given_name}&family_names={surname}&year={birth_year}&year_range=5',
-        'test_fixture': 'tests/fixtures/billiongraves_sample.html',
-        'test_params': {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
-        'location_filter_works': False,
-    },
-    'digitalarkivet': {
-        'name': 'Digitalarkivet',
-        'extractor': DigitalarkivetExtractor(),
-        'url_template': 'https://www.digitalarkivet.no/en/search/persons?fornavn={given_name}&etternavn={surname}&fodtfra={birth_year}&fodttil={birth_year_end}',
-        'test_fixture': 'tests/fixtures/digitalarkivet_sample.html',
-        'test_params': {'surname': 'Hansen', 'given_name': 'Ole', 'birth_year': 1850},
+        location_filter_works=False,
+    ),
+    'billiongraves': SourceCfg(
+        name='BillionGraves',
+        extractor_name='BillionGravesExtractor',
+        url_template='https://billiongraves.com/site/search/results?given_names={given_name}&family_names={surname}&year={birth_year}&year_range=5',
+        test_fixture='tests/fixtures/billiongraves_sample.html',
+        test_params={'surname': 'Smith', 'given_name': 'John', 'birth_year': 1880},
+        location_filter_works=False,
+    ),
+    'digitalarkivet': SourceCfg(
+        name='Digitalarkivet',
+        extractor_name='DigitalarkivetExtractor',
+        url_template='https://www.digitalarkivet.no/en/search/persons?fornavn={given_name}&etternavn={surname}&fodtfra={birth_year}&fodttil={birth_year_end}',
+        test_fixture='tests/fixtures/digitalarkivet_sample.html',
+        test_params={'surname': 'Hansen', 'given_name': 'Ole', 'birth_year': 1850},
         # Norway-only, no location filter needed
-        'location_filter_works': False,
-    },
-    'irishgenealogy': {
-        'name': 'IrishGenealogy.ie',
-        'extractor': IrishGenealogyExtractor(),
-        'url_template': 'https://www.irishgenealogy.ie/en/civil-records/search-civil-records?surname={surname}&firstname={given_name}&yearfrom={birth_year}&yearto={birth_year_end}',
-        'test_fixture': 'tests/fixtures/irishgenealogy_sample.html',
-        'test_params': {'surname': "O'Brien", 'given_name': 'Patrick', 'birth_year': 1870},
+        location_filter_works=False,
+    ),
+    'irishgenealogy': SourceCfg(
+        name='IrishGenealogy.ie',
+        extractor_name='IrishGenealogyExtractor',
+        url_template='https://www.irishgenealogy.ie/en/civil-records/search-civil-records?surname={surname}&firstname={given_name}&yearfrom={birth_year}&yearto={birth_year_end}',
+        test_fixture='tests/fixtures/irishgenealogy_sample.html',
+        test_params={'surname': "O'Brien", 'given_name': 'Patrick', 'birth_year': 1870},
         # Ireland-only, no location filter needed
-        'location_filter_works': False,
-    },
+        location_filter_works=False,
+    ),
     # NOTE: Matricula is NOT name-searchable - it's a location-based parish register browser
     # The search at /en/suchen/ only allows searching by place name, not person name
-    # Keeping for reference but marking as disabled
-    # 'matricula': {
-    #     'name': 'Matricula',
-    #     'extractor': MatriculaExtractor(),
-    #     'url_template': None,  # No name search available
-    #     'test_fixture': 'tests/fixtures/matricula_sample.html',
-    #     'test_params': {'surname': 'Mueller', 'given_name': 'Johann', 'birth_year': 1850},
-    #     'disabled': True,
-    #     'note': 'Location-based only - browse by parish at https://data.matricula-online.eu/en/suchen/'
-    # },
-    'scotlandspeople': {
-        'name': 'ScotlandsPeople',
-        'extractor': ScotlandsPeopleExtractor(),
-        'url_template': 'https://www.scotlandspeople.gov.uk/record-results?surname={surname}&forename={given_name}&from_year={birth_year}&to_year={birth_year_end}',
-        'test_fixture': 'tests/fixtures/scotlandspeople_sample.html',
-        'test_params': {'surname': 'MacDonald', 'given_name': 'James', 'birth_year': 1860},
+    # Keeping for reference but disabled
+    # Location-based only - browse by parish at https://data.matricula-online.eu/en/suchen/
+    # 'matricula': SourceCfg(
+    #     name='Matricula',
+    #     extractor_name='MatriculaExtractor',
+    #     url_template=None,  # No name search available
+    #     test_fixture='tests/fixtures/matricula_sample.html',
+    #     test_params={'surname': 'Mueller', 'given_name': 'Johann', 'birth_year': 1850},
+    # ),
+    'scotlandspeople': SourceCfg(
+        name='ScotlandsPeople',
+        extractor_name='ScotlandsPeopleExtractor',
+        url_template='https://www.scotlandspeople.gov.uk/record-results?surname={surname}&forename={given_name}&from_year={birth_year}&to_year={birth_year_end}',
+        test_fixture='tests/fixtures/scotlandspeople_sample.html',
+        test_params={'surname': 'MacDonald', 'given_name': 'James', 'birth_year': 1860},
         # Scotland-only, no location filter needed
-        'location_filter_works': False,
-    },
-    'anom': {
-        'name': 'ANOM',
-        'extractor': ANOMExtractor(),
+        location_filter_works=False,
+    ),
+    'anom': SourceCfg(
+        name='ANOM',
+        extractor_name='ANOMExtractor',
         # Correct URL: form-based search that produces results at /archive/resultats/basebagne/
-        'url_template': 'https://recherche-anom.culture.gouv.fr/archive/resultats/basebagne/n:174?RECH_nom={surname}&RECH_prenom={given_name}&type=basebagne',
-        'test_fixture': 'tests/fixtures/anom_sample.html',
-        'test_params': {'surname': 'Martin', 'given_name': 'Jean', 'birth_year': 1850},
+        url_template='https://recherche-anom.culture.gouv.fr/archive/resultats/basebagne/n:174?RECH_nom={surname}&RECH_prenom={given_name}&type=basebagne',
+        test_fixture='tests/fixtures/anom_sample.html',
+        test_params={'surname': 'Martin', 'given_name': 'Jean', 'birth_year': 1850},
         # French colonial archives only
-        'location_filter_works': False,
-    }
+        location_filter_works=False,
+    ),
 }
 
 
-def fetch_freebmd_with_playwright(params: dict, verbose: bool = False) -> str:
-    """Fetch FreeBMD results using Playwright form submission
+# Placeholders a URL template may use: search params plus the location variants
+URL_FIELDS = frozenset({
+    'surname', 'given_name', 'birth_year', 'birth_year_end', 'location',
+    'country', 'country_lower', 'region', 'region_lower', 'location_lower',
+})
 
-    FreeBMD requires POST form submission to get results.
-    Has a 3000 record limit - auto-narrows date range if exceeded.
+
+def compile_url_template(template):
+    """Pre-parse a str.format URL template into a builder taking a params mapping
+
+    Unknown placeholders, conversions and format specs are rejected up front.
     """
-    from genealogy_extractors.error_tracker import log_error
-    from genealogy_extractors.cdp_client import _browser_semaphore, cleanup_stale_tabs
-    import os
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if field is not None and (field not in URL_FIELDS or format_spec or conversion):
+            raise ValueError(f"Unsupported placeholder {{{field}}} in URL template: {template}")
+        parts.append((literal, field))
+
+    def build(params):
+        return ''.join(literal + (str(params[field]) if field is not None else '')
+                       for literal, field in parts)
+
+    return build
+
+
+# Builders for every URL template, keyed by the template string
+URL_BUILDERS = {
+    template: compile_url_template(template)
+    for source in SOURCES.values()
+    for template in (source.url_template, source.url_template_with_location)
+    if template
+}
+
+
+@lru_cache(maxsize=None)
+def get_extractor(source_key):
+    """Return the extractor for a source, importing and constructing it on first use"""
+    return getattr(extractors, SOURCES[source_key].extractor_name)()
+
 
+# Shared HTTP session for JSON API sources, so keep-alive reuses TCP/TLS connections
+_api_session = None
+_api_session_lock = threading.Lock()
+
+
+def get_api_session():
+    """Return the shared requests session, importing requests on first use"""
+    global _api_session
+    with _api_session_lock:
+        if _api_session is None:
+            import requests
+            _api_session = requests.Session()
+            _api_session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            atexit.register(_api_session.close)
+        return _api_session
+
+
+# LRU of parsed records keyed by (source, content digest, params) - see extract_records_cached
+EXTRACT_CACHE_SIZE = 256
+_extract_cache = OrderedDict()
+_extract_cache_lock = threading.Lock()
+
+
+def extract_records_cached(source_key, content, params):
+    """Run the source's extractor, reusing the result for identical content + params
+
+    Re-extracting the same page (test mode, cached responses) skips the HTML
+    parse. Callers get fresh top-level record dicts, but nested values such as
+    raw_data are shared with the cache and must not be mutated.
+    """
+    data = content.encode('utf-8', 'surrogatepass') if isinstance(content, str) else content
     try:
-        from playwright.sync_api import sync_playwright
-        import time
+        key = (source_key, hashlib.blake2b(data, digest_size=16).digest(), tuple(sorted(params.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable param values - just extract
+        return get_extractor(source_key).extract_records(content, params)
 
-        # Suppress Node.js deprecation warnings
-        os.environ['NODE_OPTIONS'] = '--no-deprecation'
+    with _extract_cache_lock:
+        records = _extract_cache.get(key)
+        if records is not None:
+            _extract_cache.move_to_end(key)
 
-        # Cleanup stale tabs before search
-        cleanup_stale_tabs()
+    if records is None:
+        records = get_extractor(source_key).extract_records(content, params)
+        with _extract_cache_lock:
+            _extract_cache[key] = records
+            if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+                _extract_cache.popitem(last=False)
 
-        surname = params.get('surname', '') or ''
-        given_name = params.get('given_name', '') or ''
-        birth_year = params.get('birth_year', 1880)
-        # Start with 2-year range to avoid 3000 limit on common names
-        birth_year_end = params.get('birth_year_end', birth_year + 2)
+    return [dict(record) for record in records]
 
-        debug("FreeBMD", f"Searching for {given_name} {surname} ({birth_year}-{birth_year_end})")
 
-        # Acquire semaphore to limit concurrent browser tabs
-        with _browser_semaphore, sync_playwright() as p:
-            # Connect to existing Chrome
-            browser = p.chromium.connect_over_cdp("http://localhost:9222")
-            context = browser.contexts[0]
+def trim_to_results(content: str, marker: Optional[str]) -> str:
+    """Drop the page head (scripts, styles, navigation) before the first result
+
+    Cuts at the start of the tag containing the first occurrence of marker, so
+    the parser only sees the results region onwards. Content is returned
+    unchanged when there is no marker or it doesn't appear.
+    """
+    if not marker or not isinstance(content, str):
+        return content
+    pos = content.find(marker)
+    if pos < 0:
+        return content
+    start = content.rfind('<', 0, pos)
+    return content[start:] if start > 0 else content
 
-            # Always create a new page for FreeBMD (avoid stale tabs)
-            page = context.new_page()
+
+def dump_json(data) -> bytes:
+    """Serialize results to indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def dump_json_line(data) -> bytes:
+    """Serialize one result as a compact JSON Lines record (trailing newline included)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, default=str).encode('utf-8') + b'\n'
+
+
+def open_output(path: str, mode: str):
+    """Open a binary output file, gzip-compressed when path ends in .gz"""
+    if path.endswith('.gz'):
+        # Level 1 costs almost no CPU and still shrinks the repetitive JSON several-fold
+        return gzip.open(path, mode, compresslevel=1)
+    return open(path, mode)
+
+
+def normalize_params(params: dict) -> MappingProxyType:
+    """Fill in derived search parameters once, before dispatching to sources.
+
+    Adds birth_year_end (birth_year + 10) when the caller didn't supply one.
+    The result is read-only so a single instance can be shared by every
+    source, including across research.py's worker threads. Already-normalized
+    params are returned as-is rather than copied again.
+    """
+    if isinstance(params, MappingProxyType) and (
+            'birth_year_end' in params or params.get('birth_year') is None):
+        return params
+    normalized = dict(params)
+    if 'birth_year_end' not in normalized and normalized.get('birth_year') is not None:
+        normalized['birth_year_end'] = normalized['birth_year'] + 10
+    return MappingProxyType(normalized)
+
+
+FREEBMD_SEARCH_URL = "https://www.freebmd.org.uk/cgi/search.pl"
+FREEBMD_LIMIT_TEXT = 'maximum number that can be displayed is 3000'
+# Present once a search has finished: the results data script, the 3000-limit
+# notice, or the .error message FreeBMD shows when nothing matches
+FREEBMD_DONE_SELECTOR = ('script:has-text("searchData"), :text("maximum number that can be displayed"), '
+                         '.error')
+
+
+class _FreeBMDSession(PlaywrightSession):
+    """Playwright session holding the tab reused across FreeBMD searches
+
+    The tab is replaced every RECYCLE_EVERY searches to bound browser memory.
+    """
+
+    RECYCLE_EVERY = 50
+
+    def __init__(self):
+        super().__init__('freebmd-playwright')
+        self._page = None
+        self._searches = 0
+
+    def get_page(self):
+        """Return the shared FreeBMD tab, connecting or recycling it as needed (session thread only)"""
+        if self._page is not None and (self._searches >= self.RECYCLE_EVERY or self._page.is_closed()):
+            self._close_page()
+
+        browser = self.get_browser()
+
+        if self._page is None:
+            self._page = browser.contexts[0].new_page()
 
             # Auto-dismiss any dialogs to prevent crashes
             def safe_dismiss(dialog):
@@ -281,91 +440,242 @@ def fetch_freebmd_with_playwright(params: dict, verbose: bool = False) -> str:
                     dialog.dismiss()
                 except Exception:
                     pass  # Dialog may have already closed
-            page.on("dialog", safe_dismiss)
+            self._page.on("dialog", safe_dismiss)
+            self._searches = 0
 
+        self._searches += 1
+        return self._page
+
+    def _close_page(self):
+        page, self._page = self._page, None
+        if page is not None:
             try:
-                # Navigate to search page
-                page.goto("https://www.freebmd.org.uk/cgi/search.pl", timeout=30000)
-                page.wait_for_selector('form[name="search"]', timeout=10000)
+                page.close()
+            except Exception:
+                pass
 
-                debug("FreeBMD", "Filling form...")
+    def reset(self):
+        """Close the tab and drop the Playwright connection (session thread only)"""
+        self._close_page()
+        super().reset()
 
-                # Check Births checkbox
-                births_checkbox = page.locator('input#typeBirths')
-                if not births_checkbox.is_checked():
-                    births_checkbox.check()
 
-                # Fill form fields
-                page.fill('input[name="surname"]', surname)
-                if given_name:
-                    page.fill('input[name="given"]', given_name)
-                page.fill('input[name="start"]', str(birth_year))
-                page.fill('input[name="end"]', str(birth_year_end))
+_freebmd_session = _FreeBMDSession()
+atexit.register(_freebmd_session.close)
 
-                debug("FreeBMD", "Submitting form...")
 
-                # Submit and wait for results
-                page.click('input[name="find"]')
+def _submit_freebmd_search(page, surname: str, given_name: str, start_year, end_year) -> str:
+    """Fill and submit the FreeBMD births search form, returning the results HTML"""
+    page.goto(FREEBMD_SEARCH_URL, timeout=30000)
+    page.wait_for_selector('form[name="search"]', timeout=10000)
 
-                # Wait for page to load
-                time.sleep(4)
+    # Check Births checkbox
+    births_checkbox = page.locator('input#typeBirths')
+    if not births_checkbox.is_checked():
+        births_checkbox.check()
 
-                # Get content
-                content = page.content()
+    # Fill form fields
+    page.fill('input[name="surname"]', surname)
+    if given_name:
+        page.fill('input[name="given"]', given_name)
+    page.fill('input[name="start"]', str(start_year))
+    page.fill('input[name="end"]', str(end_year))
 
-                # Check if we exceeded the 3000 limit
-                if 'maximum number that can be displayed is 3000' in content:
-                    debug("FreeBMD", "Exceeded 3000 limit, narrowing to 1-year range...")
+    debug("FreeBMD", "Submitting form...")
 
-                    # Retry with just the birth year (1-year range)
-                    page.goto("https://www.freebmd.org.uk/cgi/search.pl", timeout=30000)
-                    page.wait_for_selector('form[name="search"]', timeout=10000)
+    # Submit and wait for results: let the POST settle, then wait for the results
+    # data, the 3000-limit notice or the no-matches message rather than sleeping
+    # a fixed 4 seconds
+    page.click('input[name="find"]')
+    try:
+        page.wait_for_load_state('networkidle', timeout=15000)
+    except Exception:
+        pass  # Slow trackers can keep the network busy - the marker wait below decides
+    try:
+        page.wait_for_selector(FREEBMD_DONE_SELECTOR, state='attached', timeout=5000)
+    except Exception:
+        pass  # No marker after 5s - read whatever the page has
 
-                    births_checkbox = page.locator('input#typeBirths')
-                    if not births_checkbox.is_checked():
-                        births_checkbox.check()
+    return page.content()
 
-                    page.fill('input[name="surname"]', surname)
-                    if given_name:
-                        page.fill('input[name="given"]', given_name)
-                    page.fill('input[name="start"]', str(birth_year))
-                    page.fill('input[name="end"]', str(birth_year))  # Same year = 1 year range
 
-                    page.click('input[name="find"]')
-                    time.sleep(4)
-                    content = page.content()
+def _search_freebmd(surname: str, given_name: str, birth_year, birth_year_end) -> str:
+    """Run a FreeBMD search on the shared tab (session thread only)"""
+    # Hold a browser slot to limit concurrent tabs and keep the tab janitor off
+    with browser_slot():
+        try:
+            page = _freebmd_session.get_page()
 
-                    # If still exceeded, we can't narrow further
-                    if 'maximum number that can be displayed is 3000' in content:
-                        debug("FreeBMD", "Still exceeded with 1-year range - name too common")
-                        return ""
+            debug("FreeBMD", "Filling form...")
+            content = _submit_freebmd_search(page, surname, given_name, birth_year, birth_year_end)
 
-                debug("FreeBMD", f"Got {len(content)} bytes")
+            # Check if we exceeded the 3000 limit
+            if FREEBMD_LIMIT_TEXT in content:
+                debug("FreeBMD", "Exceeded 3000 limit, narrowing to 1-year range...")
 
-                return content
+                # Retry on the same tab with just the birth year (same year = 1 year range),
+                # releasing the oversized first page before fetching the second
+                del content
+                content = _submit_freebmd_search(page, surname, given_name, birth_year, birth_year)
 
-            finally:
-                # Always close the tab
-                page.close()
+                # If still exceeded, we can't narrow further
+                if FREEBMD_LIMIT_TEXT in content:
+                    debug("FreeBMD", "Still exceeded with 1-year range - name too common")
+                    return ""
+        except Exception:
+            # Drop the connection so the next search starts clean
+            _freebmd_session.reset()
+            raise
+
+    debug("FreeBMD", f"Got {len(content)} bytes")
+
+    return content
+
+
+def fetch_freebmd_with_playwright(params: dict, verbose: bool = False) -> str:
+    """Fetch FreeBMD results using Playwright form submission
+
+    FreeBMD requires POST form submission to get results.
+    Has a 3000 record limit - auto-narrows date range if exceeded.
+    The Playwright connection and tab are reused across calls (see _FreeBMDSession).
+    """
+    from genealogy_extractors.error_tracker import log_error
+    import os
+
+    try:
+        # Suppress Node.js deprecation warnings
+        os.environ['NODE_OPTIONS'] = '--no-deprecation'
+
+        surname = params.get('surname', '') or ''
+        given_name = params.get('given_name', '') or ''
+        birth_year = params.get('birth_year', 1880)
+        # Start with 2-year range to avoid 3000 limit on common names
+        # (normalized params carry a wider default birth_year_end)
+        birth_year_end = min(params.get('birth_year_end', birth_year + 2), birth_year + 2)
+
+        debug("FreeBMD", f"Searching for {given_name} {surname} ({birth_year}-{birth_year_end})")
+
+        return _freebmd_session.run(_search_freebmd, surname, given_name, birth_year, birth_year_end)
 
     except Exception as e:
         error_msg = str(e)
-        log_error('freebmd', 'PLAYWRIGHT_ERROR', error_msg, search_params=params)
+        log_error('freebmd', 'PLAYWRIGHT_ERROR', error_msg, search_params=dict(params))
         error("FreeBMD", f"Playwright fetch failed: {error_msg}")
         return ""
 
 
-def extract_from_source(source_key, params, test_mode=False, verbose=False, save_html=False):
-    """Extract records from a single source (production or test mode)"""
+WIKITREE_API_URL = "https://api.wikitree.com/api.php"
+
+
+def fetch_wikitree_api(params: dict, verbose: bool = False) -> str:
+    """Search the WikiTree API, returning the raw JSON text
+
+    Goes through the shared rate limiter (WikiTree allows 200/min, 4000/hr).
+    """
+    api_params = {
+        'action': 'searchPerson',
+        'FirstName': params.get('given_name', ''),
+        'LastName': params.get('surname', ''),
+        'BirthDate': str(params.get('birth_year', '')),
+        'BirthDateDecade': str((params.get('birth_year', 1900) // 10) * 10),
+        'format': 'json',
+        'limit': 20,
+        'fields': 'Id,Name,FirstName,LastNameAtBirth,BirthDate,BirthLocation,DeathDate'
+    }
+
+    debug("WikiTree", f"Fetching API: {WIKITREE_API_URL}")
+
+    def fetch_wikitree():
+        response = get_api_session().get(WIKITREE_API_URL, params=api_params, timeout=15)
+        response.raise_for_status()
+        return response.text
+
+    return get_rate_limiter().retry_with_backoff(fetch_wikitree, source='wikitree')
+
+
+def fetch_matchid_api(params: dict, verbose: bool = False) -> dict:
+    """Search MatchID (French death records, 1970-present)
+
+    The MatchID client returns records directly rather than page content, so
+    this returns the finished extract_from_source result.
+    """
+    records = get_extractor('matchid').search(
+        surname=params.get('surname', ''),
+        given_name=params.get('given_name', ''),
+        birth_year=params.get('birth_year'),
+        size=20
+    )
+
+    debug("MatchID", f"Found {len(records)} records")
+
+    return {
+        'source': SOURCES['matchid'].name,
+        'success': True,
+        'count': len(records),
+        'records': records
+    }
+
+
+# Fetchers for sources without a url_template, called as fetcher(params, verbose).
+# They return page/API content to extract from, or a finished result dict.
+API_FETCHERS = {
+    'wikitree': fetch_wikitree_api,
+    'freebmd': fetch_freebmd_with_playwright,
+    'matchid': fetch_matchid_api,
+}
+
+
+# Where --save-html writes fetched pages; created on the first save of the run
+SAVED_HTML_DIR = Path('test/fixtures')
+_saved_html_dir_ready = False
+
+
+def _ensure_saved_html_dir():
+    """Create SAVED_HTML_DIR once per process instead of on every save"""
+    global _saved_html_dir_ready
+    if not _saved_html_dir_ready:
+        SAVED_HTML_DIR.mkdir(parents=True, exist_ok=True)
+        _saved_html_dir_ready = True
+
+
+def extract_from_source(source_key, params, test_mode=False, verbose=False, save_html=False,
+                        trace_errors=False, use_cache=True):
+    """Extract records from a single source (production or test mode)
+
+    Failed results carry 'error_short', a truncated message for status lines.
+    Stack traces are only printed when both verbose mode and trace_errors are on.
+    With use_cache, live content is served from / stored in the response cache
+    for source.cache_ttl seconds, and a stale copy is used if a bot check blocks the fetch.
+    Only pages that yield records are stored, so error, rate-limit and
+    no-results pages are never replayed from the cache.
+    """
+
+    # Plain-dict callers need birth_year_end filled in for the URL templates;
+    # params already normalized by the caller are passed through as-is
+    params = normalize_params(params)
 
     source = SOURCES[source_key]
-    source_name = source['name']
+    source_name = source.name
+
+    # Don't spend a browser round-trip on a source that already hit today's limit
+    if not test_mode and daily_limit_reached(source_key):
+        error_msg = f"{source_name} daily search limit reached earlier today"
+        debug(source_name, "Skipping - daily limit already reached today")
+        return {
+            'source': source_name,
+            'success': False,
+            'error': error_msg,
+            'error_short': error_msg[:40],
+            'error_type': 'DAILY_LIMIT',
+            'daily_limit': True,
+            'records': []
+        }
 
     if verbose:
         info(f"\n{'='*80}")
         info(f"Source: {source_name}")
         if test_mode:
-            debug(source_name, f"Mode: TEST (using fixture: {source['test_fixture']})")
+            debug(source_name, f"Mode: TEST (using fixture: {source.test_fixture})")
         else:
             debug(source_name, "Mode: PRODUCTION (live fetch)")
         info(f"{'='*80}")
@@ -373,99 +683,59 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
     try:
         # Get content (from fixture or live)
         if test_mode:
-            fixture_path = Path(source['test_fixture'])
-            if not fixture_path.exists():
-                raise FileNotFoundError(f"Fixture not found: {source['test_fixture']}")
-            
-            with open(fixture_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            # Extractors mix regex and JSON parsing over str, so decode once here
+            try:
+                content = Path(source.test_fixture).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Fixture not found: {source.test_fixture}") from None
+
             # Use test params
-            params = source['test_params']
+            params = source.test_params
         
         else:
-            # Production: fetch live data
-            if source['url_template'] is None:
-                # Special handling for API-based sources
-                if source_key == 'wikitree':
-                    # WikiTree API with rate limiting (200/min, 4000/hr)
-                    api_url = "https://api.wikitree.com/api.php"
-                    api_params = {
-                        'action': 'searchPerson',
-                        'FirstName': params.get('given_name', ''),
-                        'LastName': params.get('surname', ''),
-                        'BirthDate': str(params.get('birth_year', '')),
-                        'BirthDateDecade': str((params.get('birth_year', 1900) // 10) * 10),
-                        'format': 'json',
-                        'limit': 20,
-                        'fields': 'Id,Name,FirstName,LastNameAtBirth,BirthDate,BirthLocation,DeathDate'
-                    }
-
-                    debug("WikiTree", f"Fetching API: {api_url}")
-
-                    def fetch_wikitree():
-                        response = requests.get(api_url, params=api_params, timeout=15)
-                        response.raise_for_status()
-                        return response.text
-
-                    rate_limiter = get_rate_limiter()
-                    content = rate_limiter.retry_with_backoff(fetch_wikitree, source='wikitree')
-
-                elif source_key == 'freebmd':
-                    # FreeBMD requires Playwright form submission
-                    content = fetch_freebmd_with_playwright(params, verbose)
-
-                elif source_key == 'matchid':
-                    # MatchID API - French death records (1970-present)
-                    # Returns records directly, not HTML content
-                    extractor = source['extractor']
-                    records = extractor.search(
-                        surname=params.get('surname', ''),
-                        given_name=params.get('given_name', ''),
-                        birth_year=params.get('birth_year'),
-                        size=20
-                    )
-
-                    debug("MatchID", f"Found {len(records)} records")
-
-                    # MatchID returns records directly, skip normal extraction
-                    return {
-                        'source': source['name'],
-                        'success': True,
-                        'count': len(records),
-                        'records': records
-                    }
-
-                else:
-                    raise NotImplementedError(f"{source['name']} requires API implementation")
+            # Production: fetch live data (unless a fresh cached copy exists)
+            cache = get_response_cache() if use_cache else None
+            key = cache_key(source_key, params)
+            content = cache.get(key, max_age=source.cache_ttl) if cache else None
+            from_cache = content is not None
+
+            if from_cache:
+                debug(source_name, "Using cached response")
+            elif source.url_template is None:
+                # API-based sources have their own fetchers
+                fetcher = API_FETCHERS.get(source_key)
+                if fetcher is None:
+                    raise NotImplementedError(f"{source.name} requires API implementation")
+                content = fetcher(params, verbose)
+
+                if isinstance(content, dict):
+                    # Fetcher returned the finished result, skip normal extraction
+                    return content
             else:
-                # Build URL
-                url_params = params.copy()
-                if 'birth_year_end' not in url_params and 'birth_year' in url_params:
-                    url_params['birth_year_end'] = url_params['birth_year'] + 10
-
                 # Build location variants for different source needs:
                 # - {country}: "France" (for Geni, Ancestry)
                 # - {region}: "Alsace" or "Sicily" (for regional sources)
                 # - {location}: "Paris, France" (for specific place sources)
                 # Priority: country > region > location (extracted from location string)
-                country = url_params.get('country', '')
-                region = url_params.get('region', '')
-                location = url_params.get('location', '')
-
-                # Ensure all location variants are available
-                url_params['country'] = country
-                url_params['country_lower'] = country.lower() if country else ''
-                url_params['region'] = region
-                url_params['region_lower'] = region.lower() if region else ''
-                url_params['location_lower'] = location.lower() if location else ''
+                country = params.get('country', '')
+                region = params.get('region', '')
+                location = params.get('location', '')
+
+                # Overlay the location variants on the shared params without copying them
+                url_params = ChainMap({
+                    'country': country,
+                    'country_lower': country.lower() if country else '',
+                    'region': region,
+                    'region_lower': region.lower() if region else '',
+                    'location_lower': location.lower() if location else '',
+                }, params)
 
                 # Determine which location to use for URL template
                 # Sources specify which field they need via their URL template placeholders
                 has_location_data = country or region or location
 
                 # Special handling for Filae - uses location resolver for French locations
-                if source.get('use_location_resolver') and has_location_data:
+                if source.use_location_resolver and has_location_data:
                     # Use region first, then location for Filae's GeoNames lookup
                     filae_location = region or location
                     url = build_filae_url(
@@ -475,43 +745,61 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
                         birth_year_end=url_params.get('birth_year_end'),
                         location=filae_location
                     )
-                elif has_location_data and source.get('url_template_with_location') and source.get('location_filter_works'):
-                    url = source['url_template_with_location'].format(**url_params)
+                elif has_location_data and source.url_template_with_location and source.location_filter_works:
+                    url = URL_BUILDERS[source.url_template_with_location](url_params)
                 else:
-                    url = source['url_template'].format(**url_params)
+                    url = URL_BUILDERS[source.url_template](url_params)
 
                 debug(source_name, f"Fetching: {url}")
 
                 # Pass wait_for_selector if source needs it (for JS-heavy sites)
-                wait_selector = source.get('wait_for_selector')
-                content = fetch_page_content(url, source_name=source['name'], wait_for_selector=wait_selector)
+                try:
+                    content = fetch_page_content(url, source_name=source_name, wait_for_selector=source.wait_for_selector)
+                except BotCheckDetected:
+                    # Fall back to a stale cached copy so the run can proceed
+                    content = cache.get(key, max_age=None) if cache else None
+                    if content is None:
+                        raise
+                    from_cache = True
+                    warn(source_name, "BOT CHECK DETECTED - using stale cached response")
 
             # Save HTML if requested
             if save_html:
-                from datetime import datetime
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 safe_name = f"{params.get('given_name', 'unknown')}_{params.get('surname', 'unknown')}_{params.get('birth_year', 'unknown')}"
-                filename = f"test/fixtures/{source_key}-{safe_name}-{timestamp}.html"
-                Path('test/fixtures').mkdir(parents=True, exist_ok=True)
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                filename = f"{SAVED_HTML_DIR}/{source_key}-{safe_name}-{timestamp}.html"
+                _ensure_saved_html_dir()
+                with open(filename, 'wb') as f:
+                    f.write(content.encode('utf-8', 'replace'))
                 info(f"[{source_name}] 💾 Saved HTML to {filename}")
         
-        # Extract records
-        records = source['extractor'].extract_records(content, params)
+        # Extract records. Only fixtures and cached responses can repeat, so a
+        # freshly fetched page skips hashing it for the memo
+        results = trim_to_results(content, source.result_marker)
+        if test_mode or from_cache:
+            records = extract_records_cached(source_key, results, params)
+        else:
+            records = get_extractor(source_key).extract_records(results, params)
         
         debug(source_name, f"Extracted {len(records)} records")
+
+        # Extractors return no records for error and no-results pages, so only
+        # pages that parsed into records are worth replaying later
+        if not test_mode and cache and records and not from_cache:
+            cache.set(key, content, source=source_key)
+
         if is_verbose() and records:
-            info(f"[{source_name}] Top 5 results:")
+            lines = [f"[{source_name}] Top 5 results:"]
             for i, rec in enumerate(records[:5], 1):
                 name = rec.get('name', 'Unknown')
                 birth = rec.get('birth_year', '?')
                 place = rec.get('birth_place') or 'unknown'
                 score = rec.get('match_score', 0)
-                info(f"  {i}. {name} (b. {birth}) - {place[:40]} [Score: {score}]")
+                lines.append(f"  {i}. {name} (b. {birth}) - {place[:40]} [Score: {score}]")
+            info_block(lines)
         
         return {
-            'source': source['name'],
+            'source': source.name,
             'success': True,
             'count': len(records),
             'records': records
@@ -528,6 +816,7 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
             'source': source_name,
             'success': False,
             'error': error_msg,
+            'error_short': error_msg[:40],
             'error_type': 'BOT_CHECK',
             'bot_check': True,  # Flag for caller to handle specially
             'records': []
@@ -535,6 +824,7 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
 
     except DailyLimitReached as e:
         # Daily limit reached - don't mark as processed, skip this source for today
+        mark_daily_limit(source_key)
         error_msg = str(e)
         warn(source_name, "DAILY LIMIT REACHED")
         info(f"   This source has reached its daily search limit. Try again tomorrow.")
@@ -543,6 +833,7 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
             'source': source_name,
             'success': False,
             'error': error_msg,
+            'error_short': error_msg[:40],
             'error_type': 'DAILY_LIMIT',
             'daily_limit': True,  # Flag for caller to skip this source
             'records': []
@@ -554,34 +845,26 @@ def extract_from_source(source_key, params, test_mode=False, verbose=False, save
         stack_trace = traceback.format_exc()
 
         # Determine error type
-        if '429' in error_msg or 'rate limit' in error_msg.lower():
-            error_type = 'RATE_LIMIT'
-        elif 'timeout' in error_msg.lower():
-            error_type = 'TIMEOUT'
-        elif 'navigation' in error_msg.lower():
-            error_type = 'NAVIGATION'
-        elif '404' in error_msg:
-            error_type = 'NOT_FOUND'
-        else:
-            error_type = 'UNKNOWN'
+        error_type = classify_error(error_msg)
 
         # Log error for tracking
         log_error(
             source=source_key,
             error_type=error_type,
             message=error_msg,
-            search_params=params,
+            search_params=dict(params),
             stack_trace=stack_trace
         )
 
         error(source_name, error_msg)
-        if is_verbose():
+        if trace_errors and is_verbose():
             traceback.print_exc()
 
         return {
             'source': source_name,
             'success': False,
             'error': error_msg,
+            'error_short': error_msg[:40],
             'error_type': error_type,
             'records': []
         }
@@ -609,9 +892,15 @@ def main():
     # Output options
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Show detailed output')
-    parser.add_argument('--output', '-o', help='Save results to JSON file')
+    parser.add_argument('--debug', action='store_true',
+                       help='With --verbose, print stack traces for failed sources')
+    parser.add_argument('--output', '-o',
+                        help='Save results to JSON file (gzipped if it ends in .gz); '
+                             '.jsonl appends one result per line as sources finish')
     parser.add_argument('--save-html', action='store_true',
                        help='Save fetched HTML to test/fixtures/ directory')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always fetch live pages instead of using the response cache')
     
     args = parser.parse_args()
     
@@ -624,12 +913,12 @@ def main():
         parser.error("Must specify --source, --all-sources, or --test")
 
     # Build search params
-    params = {
+    params = normalize_params({
         'surname': args.surname,
         'given_name': args.given_name,
         'birth_year': args.birth_year,
         'location': args.location
-    }
+    })
 
     # Determine which sources to use
     if args.test:
@@ -643,49 +932,86 @@ def main():
     set_verbose(args.verbose)
 
     # Run extraction
-    info("="*80)
     if args.test:
-        info("GENEALOGY EXTRACTION - TEST MODE")
+        header = ["GENEALOGY EXTRACTION - TEST MODE"]
+    else:
+        header = ["GENEALOGY EXTRACTION - PRODUCTION MODE",
+                  f"Searching for: {args.given_name} {args.surname} (b. {args.birth_year})"]
+    info_block(["="*80, *header, "="*80])
+
+    def run_source(source_key):
+        return extract_from_source(source_key, params, test_mode=args.test, verbose=args.verbose,
+                                   save_html=args.save_html, trace_errors=args.debug,
+                                   use_cache=not args.no_cache)
+
+    # .jsonl / .jsonl.gz output is appended one result per line as sources finish
+    stream = None
+    if args.output and args.output.endswith(('.jsonl', '.jsonl.gz')):
+        stream = open_output(args.output, 'ab')
+        line_context = {
+            'mode': 'test' if args.test else 'production',
+            'search_params': dict(params) if not args.test else None,
+        }
+
+    executor = None
+    if args.test or len(sources_to_run) == 1:
+        pending = map(run_source, sources_to_run)
     else:
-        info("GENEALOGY EXTRACTION - PRODUCTION MODE")
-        info(f"Searching for: {args.given_name} {args.surname} (b. {args.birth_year})")
-    info("="*80)
+        # Live fetches are I/O-bound against distinct hosts, so search all sources at
+        # once; the CDP client's semaphore still caps how many browser tabs are open.
+        executor = ThreadPoolExecutor(max_workers=len(sources_to_run))
+        pending = executor.map(run_source, sources_to_run)
 
     results = []
-    for source_key in sources_to_run:
-        result = extract_from_source(source_key, params, test_mode=args.test, verbose=args.verbose, save_html=args.save_html)
-        results.append(result)
-
-        if not args.verbose:
-            status = "✅" if result['success'] else "❌"
-            count = result.get('count', 0) if result['success'] else 0
-            err_msg = f" ({result.get('error', '')[:40]})" if not result['success'] else ""
-            info(f"{status} {result['source']:20} → {count:3} records{err_msg}")
-
-    # Summary
-    info("\n" + "="*80)
-    info("SUMMARY")
-    info("="*80)
-    total_records = sum(r.get('count', 0) for r in results if r['success'])
-    successful = sum(1 for r in results if r['success'])
-    failed = sum(1 for r in results if not r['success'])
-
-    info(f"Sources tested: {len(results)}")
-    info(f"Successful: {successful}")
-    info(f"Failed: {failed}")
-    info(f"Total records: {total_records}")
+    successful = failed = total_records = 0
+    try:
+        for result in pending:
+            results.append(result)
+            if result['success']:
+                successful += 1
+                total_records += result.get('count', 0)
+            else:
+                failed += 1
+            if stream is not None:
+                stream.write(dump_json_line({'timestamp': datetime.now().isoformat(), **line_context, **result}))
+                stream.flush()
+
+            if not args.verbose:
+                status = "✅" if result['success'] else "❌"
+                count = result.get('count', 0) if result['success'] else 0
+                err_msg = f" ({result['error_short']})" if not result['success'] else ""
+                info(f"{status} {result['source']:20} → {count:3} records{err_msg}")
+    finally:
+        # Also on Ctrl-C or a write error, so a .jsonl.gz stream ends with a complete member
+        if stream is not None:
+            stream.close()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    # Summary (counts tallied as results arrived)
+    info_block([
+        "\n" + "="*80,
+        "SUMMARY",
+        "="*80,
+        f"Sources tested: {len(results)}",
+        f"Successful: {successful}",
+        f"Failed: {failed}",
+        f"Total records: {total_records}",
+    ])
 
     # Save results if requested
-    if args.output:
+    if stream is not None:
+        info(f"\n[Output] ✅ Results appended to {args.output}")
+    elif args.output:
         output_data = {
             'timestamp': datetime.now().isoformat(),
             'mode': 'test' if args.test else 'production',
-            'search_params': params if not args.test else None,
+            'search_params': dict(params) if not args.test else None,
             'results': results
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2, default=str)
+        with open_output(args.output, 'wb') as f:
+            f.write(dump_json(output_data))
         info(f"\n[Output] ✅ Results saved to {args.output}")
 
     # Exit with error code if any tests failed
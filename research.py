@@ -37,7 +37,8 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from genealogy_extractors.api_client import get_all_people_iterator, person_to_search_params, submit_research
 from genealogy_extractors.staged_findings import StagedFindings
 from genealogy_extractors.processed_tracker import get_tracker
-from extract import SOURCES, extract_from_source
+from genealogy_extractors.daily_limits import daily_limit_reached
+from extract import SOURCES, extract_from_source, normalize_params
 
 
 # Sources to skip:
@@ -47,9 +48,6 @@ from extract import SOURCES, extract_from_source
 # - irishgenealogy: Site redesigned with JavaScript form, no direct search URLs
 SKIP_SOURCES = {'wikitree', 'scotlandspeople', 'billiongraves', 'irishgenealogy'}
 
-# Track sources that hit daily limit during this session (cleared on restart)
-_daily_limit_sources = set()
-
 
 def reset_estimated_birth_year_searches(verbose: bool = False):
     """
@@ -165,9 +163,8 @@ def search_source(source_key: str, params: Dict[str, Any], person_id: str, verbo
                 'elapsed': elapsed
             }
 
-        # Don't mark as processed if daily limit - skip for rest of session
+        # Don't mark as processed if daily limit - extract_from_source remembers it for today
         if result.get('daily_limit'):
-            _daily_limit_sources.add(source_key)
             return {
                 'source': source_key,
                 'success': False,
@@ -332,13 +329,17 @@ def run_research(
         person_start = time.time()
         person_id = person["id"]
 
+        # Derived/read-only params shared by every source search for this person
+        search_params = normalize_params(params)
+
         # Filter out already-processed sources for this person
         tracker = get_tracker()
         unprocessed_sources = tracker.get_unprocessed_sources(person_id, source_keys)
 
-        # Also filter out sources that hit daily limit this session
-        if _daily_limit_sources:
-            unprocessed_sources = [s for s in unprocessed_sources if s not in _daily_limit_sources]
+        # Also filter out sources that hit daily limit today
+        limited_sources = [s for s in unprocessed_sources if daily_limit_reached(s)]
+        if limited_sources:
+            unprocessed_sources = [s for s in unprocessed_sources if s not in limited_sources]
 
         if not unprocessed_sources:
             print(f"\n[{processed}/{total_to_process}] {person['name_full']} - SKIP (all sources already searched or at daily limit)")
@@ -351,9 +352,9 @@ def run_research(
         skipped_count = len(source_keys) - len(unprocessed_sources)
         if skipped_count > 0:
             skip_reasons = []
-            if _daily_limit_sources:
-                skip_reasons.append(f"{len(_daily_limit_sources)} at daily limit")
-            skip_reasons.append(f"{skipped_count - len(_daily_limit_sources)} already searched")
+            if limited_sources:
+                skip_reasons.append(f"{len(limited_sources)} at daily limit")
+            skip_reasons.append(f"{skipped_count - len(limited_sources)} already searched")
             print(f"    Skipping: {', '.join(skip_reasons)}")
 
         person_staged = 0
@@ -361,7 +362,7 @@ def run_research(
         if parallel and len(unprocessed_sources) > 1:
             # PARALLEL: Search all sources simultaneously
             print(f"    Searching {len(unprocessed_sources)} sources in parallel...")
-            results = search_all_sources_parallel(params, unprocessed_sources, person_id, verbose, max_workers)
+            results = search_all_sources_parallel(search_params, unprocessed_sources, person_id, verbose, max_workers)
 
             for source_key, result in results.items():
                 elapsed = result.get('elapsed', 0)
@@ -407,7 +408,7 @@ def run_research(
                 try:
                     result = extract_from_source(
                         source_key,
-                        params,
+                        search_params,
                         test_mode=False,
                         verbose=verbose
                     )
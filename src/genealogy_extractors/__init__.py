@@ -2,17 +2,26 @@
 
 __version__ = "0.1.0"
 
-from .extractors import (
-    BaseRecordExtractor,
-    AncestryExtractor,
-    ANOMExtractor,
-    AntenatiExtractor,
-    FindAGraveExtractor,
-    GeneanetExtractor,
-    MatchIDExtractor,
-)
+from .extractors import BaseRecordExtractor
 from .debug_log import debug, info, warn, error, set_verbose
 
+_LAZY_EXTRACTORS = {
+    "AncestryExtractor",
+    "ANOMExtractor",
+    "AntenatiExtractor",
+    "FindAGraveExtractor",
+    "GeneanetExtractor",
+    "MatchIDExtractor",
+}
+
+
+def __getattr__(name):
+    # Defer extractor imports until a class is actually used
+    if name in _LAZY_EXTRACTORS:
+        from . import extractors
+        return getattr(extractors, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "__version__",
     "BaseRecordExtractor",
@@ -4,19 +4,26 @@ All browser automation uses Playwright connecting to Chrome via CDP.
 This avoids race conditions from mixing raw WebSocket and Playwright.
 
 Tab Management:
-- Cleans up orphaned about:blank tabs periodically before each search
-- Creates fresh tabs for each search (Playwright page objects don't persist across sessions)
-- Always closes tabs after use in finally block
+- A background janitor thread cleans up orphaned about:blank tabs periodically
+  while no search is using the browser
+- Keeps a small pool of Playwright connections open across searches (one per
+  allowed concurrent tab) instead of starting the driver for every fetch
+- Creates a fresh tab for each search and closes it in a finally block
 """
 
+import atexit
 import json
+import queue
 import subprocess
 import threading
 import time
 import os
+from concurrent.futures import Future
+from contextlib import contextmanager
 from typing import Optional
 
 from .config import get_chrome_config
+from .debug_log import debug
 
 # Suppress Node.js deprecation warnings from Playwright
 os.environ['NODE_OPTIONS'] = '--no-deprecation'
@@ -29,17 +36,24 @@ def _get_chrome_url() -> str:
     port = config.get('debug_port', 9222)
     return f"http://{host}:{port}"
 
-# Semaphore to limit concurrent browser connections (reduced from 4 to 2 to prevent CDP overload)
-_browser_semaphore = threading.Semaphore(2)
+# Semaphore to limit concurrent browser connections. Parallel searches are capped by
+# this, not by thread count; default 2 (reduced from 4 to prevent CDP overload),
+# raise chrome.max_tabs in config.json if your Chrome keeps up.
+_max_tabs = max(1, int(get_chrome_config().get('max_tabs', 2)))
+_browser_semaphore = threading.Semaphore(_max_tabs)
 
 # Track last cleanup time to avoid cleaning too frequently
 _last_cleanup_time = 0
 _cleanup_interval = 60  # Cleanup at most once per minute
+_janitor_poll = 5  # Janitor wake-up period, so a sweep skipped for a search is retried soon
 
 # Track active fetches to prevent cleanup during parallel operations
 _active_fetches = 0
 _active_fetches_lock = threading.Lock()
 
+_janitor_thread = None
+_janitor_lock = threading.Lock()
+
 
 def cleanup_stale_tabs(force: bool = False) -> int:
     """Close stale about:blank tabs to prevent tab accumulation.
@@ -52,61 +66,216 @@ def cleanup_stale_tabs(force: bool = False) -> int:
     """
     global _last_cleanup_time
 
-    # Skip cleanup if any fetches are in progress (could close tabs being used)
     with _active_fetches_lock:
+        # Skip cleanup if any fetches are in progress (could close tabs being used)
         if _active_fetches > 0:
             return 0
 
-    current_time = time.time()
-    if not force and (current_time - _last_cleanup_time) < _cleanup_interval:
-        return 0
+        if not force and (time.time() - _last_cleanup_time) < _cleanup_interval:
+            return 0
 
-    _last_cleanup_time = current_time
-    closed_count = 0
+    # Talk to the debug port outside the lock so searches aren't held up by it
+    chrome_url = _get_chrome_url()
+    tabs = _list_tabs(chrome_url)
+
+    with _active_fetches_lock:
+        # A search that started after the listing opens a tab that isn't in it,
+        # so the blank tabs listed are only unsafe to close if one is running now.
+        # A skipped sweep doesn't count towards the interval, so it's retried soon
+        if _active_fetches > 0:
+            return 0
+
+        _last_cleanup_time = time.time()
+        if not tabs:
+            return 0
+
+        # Close about:blank tabs (but keep at least one tab open)
+        blank_ids = [t.get('id') for t in tabs if t.get('url') == 'about:blank']
+        if len(blank_ids) == len(tabs):
+            blank_ids = blank_ids[1:]
+
+    return _close_tabs(chrome_url, [tab_id for tab_id in blank_ids if tab_id])
 
+
+def _list_tabs(chrome_url: str) -> list:
+    """Get the list of tabs from the Chrome debug port ([] if unreachable)"""
     try:
-        # Get list of tabs from Chrome debug port
-        chrome_url = _get_chrome_url()
         result = subprocess.run(
             ['curl', '-s', f'{chrome_url}/json'],
             capture_output=True,
             text=True,
             timeout=5
         )
-
         if result.returncode != 0:
-            return 0
+            return []
+        return json.loads(result.stdout)
+    except Exception:
+        # Don't fail the search if cleanup fails
+        return []
 
-        tabs = json.loads(result.stdout)
 
-        # Close about:blank tabs (but keep at least one tab open)
-        blank_tabs = [t for t in tabs if t.get('url') == 'about:blank']
+def _close_tabs(chrome_url: str, tab_ids: list) -> int:
+    """Close the given tabs through the debug port"""
+    closed_count = 0
 
-        # Keep at least one tab if all are blank
-        if len(blank_tabs) == len(tabs):
-            blank_tabs = blank_tabs[1:]
+    for tab_id in tab_ids:
+        try:
+            subprocess.run(
+                ['curl', '-s', f'{chrome_url}/json/close/{tab_id}'],
+                capture_output=True,
+                timeout=2
+            )
+            closed_count += 1
+        except Exception:
+            pass
 
-        for tab in blank_tabs:
-            tab_id = tab.get('id')
-            if tab_id:
-                try:
-                    subprocess.run(
-                        ['curl', '-s', f'{chrome_url}/json/close/{tab_id}'],
-                        capture_output=True,
-                        timeout=2
-                    )
-                    closed_count += 1
-                except Exception:
-                    pass
+    if closed_count > 0:
+        debug("CDP", f"Cleaned up {closed_count} stale about:blank tabs")
 
-        if closed_count > 0:
-            print(f"[CDP] Cleaned up {closed_count} stale about:blank tabs")
+    return closed_count
 
-    except Exception as e:
-        # Don't fail the search if cleanup fails
+
+def _tab_janitor():
+    """Background loop closing stale about:blank tabs every _cleanup_interval seconds
+
+    Runs on a daemon thread started by the first browser_slot(). It wakes every
+    _janitor_poll seconds; a sweep skipped while a search is in progress is
+    retried on the next wake-up instead of a full interval later.
+    """
+    while True:
+        time.sleep(_janitor_poll)
+        cleanup_stale_tabs()
+
+
+def _start_tab_janitor():
+    """Start the background tab cleanup thread on first use of the browser
+
+    The first sweep runs inline, before the caller's search counts as active,
+    so tabs left over from earlier runs are closed up front.
+    """
+    global _janitor_thread
+    with _janitor_lock:
+        if _janitor_thread is None:
+            cleanup_stale_tabs(force=True)
+            _janitor_thread = threading.Thread(target=_tab_janitor, name='cdp-tab-janitor', daemon=True)
+            _janitor_thread.start()
+
+
+@contextmanager
+def browser_slot():
+    """Hold one of the chrome.max_tabs browser slots for a search
+
+    Also marks a fetch as in progress so the janitor leaves tabs alone.
+    """
+    global _active_fetches
+
+    _start_tab_janitor()
+
+    with _browser_semaphore:
+        with _active_fetches_lock:
+            _active_fetches += 1
+        try:
+            yield
+        finally:
+            with _active_fetches_lock:
+                _active_fetches -= 1
+
+
+class PlaywrightSession:
+    """Playwright driver and CDP connection to Chrome, kept open across fetches
+
+    Playwright's sync API only works on the thread that started it, so all work
+    for a session runs on its own worker thread, whichever thread submits it.
+    Starting the driver and connecting costs hundreds of milliseconds, which
+    every fetch used to pay.
+    """
+
+    def __init__(self, name: str = 'playwright'):
+        self.name = name
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._pw = None
+        self._browser = None
+
+    def run(self, func, *args):
+        """Call func(*args) on the session thread and return its result"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+                self._thread.start()
+        future = Future()
+        self._jobs.put((future, func, args))
+        return future.result()
+
+    def _worker(self):
+        while True:
+            future, func, args = self._jobs.get()
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def get_browser(self):
+        """Return the CDP browser connection, (re)connecting if needed (session thread only)"""
+        if self._browser is not None and not self._browser.is_connected():
+            self.reset()
+
+        if self._pw is None:
+            from playwright.sync_api import sync_playwright
+            self._pw = sync_playwright().start()
+            try:
+                self._browser = self._pw.chromium.connect_over_cdp(_get_chrome_url(), timeout=30000)
+            except Exception:
+                self.reset()
+                raise
+            self._on_connect(self._browser)
+
+        return self._browser
+
+    def _on_connect(self, browser):
+        """Hook for per-connection setup such as dialog handlers"""
         pass
 
-    return closed_count
+    def reset(self):
+        """Drop the Playwright connection (session thread only)"""
+        pw, self._pw, self._browser = self._pw, None, None
+        if pw is not None:
+            try:
+                pw.stop()
+            except Exception:
+                pass
+
+    def close(self):
+        """Release the Playwright driver"""
+        if self._thread is not None:
+            self.run(self.reset)
+
+
+class _FetchSession(PlaywrightSession):
+    """Pooled session used by fetch_page_content"""
+
+    def _on_connect(self, browser):
+        # Handle dialogs at context level before any page is created
+        def handle_dialog(dialog):
+            try:
+                dialog.accept()
+            except Exception:
+                pass
+        browser.contexts[0].on("dialog", handle_dialog)
+
+
+# One session per allowed concurrent tab; fetches borrow one for their duration
+_fetch_sessions = [_FetchSession(f'cdp-playwright-{i}') for i in range(_max_tabs)]
+_fetch_session_pool = queue.Queue()
+for _session in _fetch_sessions:
+    _fetch_session_pool.put(_session)
+
+
+@atexit.register
+def _close_fetch_sessions():
+    for session in _fetch_sessions:
+        session.close()
 
 
 class BotCheckDetected(Exception):
@@ -134,22 +303,13 @@ def fetch_page_content(url: str, source_name: str = None, wait_for_selector: str
         BotCheckDetected: If bot verification requires human intervention
         DailyLimitReached: If source daily limit is hit
     """
-    global _active_fetches
-
-    # Cleanup stale tabs before each fetch (rate-limited to once per minute)
-    cleanup_stale_tabs()
-
-    # Track active fetches to prevent cleanup from closing tabs we're using
-    with _active_fetches_lock:
-        _active_fetches += 1
-
-    try:
-        # Acquire semaphore to limit concurrent tabs (max 2 at a time)
-        with _browser_semaphore:
-            return _fetch_with_playwright(url, source_name=source_name, wait_for_selector=wait_for_selector)
-    finally:
-        with _active_fetches_lock:
-            _active_fetches -= 1
+    # Limit concurrent tabs (chrome.max_tabs at a time)
+    with browser_slot():
+        session = _fetch_session_pool.get()
+        try:
+            return session.run(_fetch_with_playwright, session, url, source_name, wait_for_selector)
+        finally:
+            _fetch_session_pool.put(session)
 
 
 def _check_daily_limit(page, source_name: str = None) -> bool:
@@ -275,10 +435,12 @@ def _handle_bot_check(page, source_name: str = None, max_attempts: int = 3) -> b
     return True
 
 
-def _fetch_with_playwright(url: str, source_name: str = None, wait_for_selector: str = None) -> str:
-    """Fetch page content using Playwright via CDP.
+def _fetch_with_playwright(session: PlaywrightSession, url: str, source_name: str = None,
+                           wait_for_selector: str = None) -> str:
+    """Fetch page content in a new tab on the session's CDP connection (session thread only).
 
     Args:
+        session: Pooled Playwright session to fetch with
         url: URL to fetch
         source_name: Name of source (for logging)
         wait_for_selector: CSS selector to wait for before getting content
@@ -287,66 +449,41 @@ def _fetch_with_playwright(url: str, source_name: str = None, wait_for_selector:
         BotCheckDetected: If bot verification requires human intervention
         DailyLimitReached: If daily limit reached
     """
-    global _active_fetches
-    from playwright.sync_api import sync_playwright
-
-    # Cleanup stale about:blank tabs periodically
-    cleanup_stale_tabs()
-
-    # Track active fetches to prevent cleanup from closing tabs we're using
-    with _active_fetches_lock:
-        _active_fetches += 1
+    context = session.get_browser().contexts[0]
+    page = context.new_page()
+    should_close_tab = True
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.connect_over_cdp(_get_chrome_url(), timeout=30000)
-            context = browser.contexts[0]
+        page.goto(url, timeout=30000, wait_until="load")
 
-            # Handle dialogs at context level before page creation
-            def handle_dialog(dialog):
-                try:
-                    dialog.accept()
-                except Exception:
-                    pass
-            context.on("dialog", handle_dialog)
+        # Wait for specific selector if provided
+        if wait_for_selector:
+            try:
+                page.wait_for_selector(wait_for_selector, timeout=20000)
+            except Exception:
+                pass  # Continue anyway
 
-            page = context.new_page()
-            should_close_tab = True
+        # Small delay for final rendering
+        time.sleep(2)
 
-            try:
-                page.goto(url, timeout=30000, wait_until="load")
+        # Check for bot verification
+        try:
+            _handle_bot_check(page, source_name)
+        except BotCheckDetected:
+            should_close_tab = False
+            raise
 
-                # Wait for specific selector if provided
-                if wait_for_selector:
-                    try:
-                        page.wait_for_selector(wait_for_selector, timeout=20000)
-                    except Exception:
-                        pass  # Continue anyway
+        # Check for daily limit
+        if _check_daily_limit(page, source_name):
+            raise DailyLimitReached(
+                f"{source_name} daily search limit reached. Try again tomorrow."
+            )
 
-                # Small delay for final rendering
-                time.sleep(2)
+        return page.content()
 
-                # Check for bot verification
-                try:
-                    _handle_bot_check(page, source_name)
-                except BotCheckDetected:
-                    should_close_tab = False
-                    raise
-
-                # Check for daily limit
-                if _check_daily_limit(page, source_name):
-                    raise DailyLimitReached(
-                        f"{source_name} daily search limit reached. Try again tomorrow."
-                    )
-
-                return page.content()
-
-            finally:
-                if should_close_tab:
-                    try:
-                        page.close(run_before_unload=False)
-                    except Exception:
-                        pass
     finally:
-        with _active_fetches_lock:
-            _active_fetches -= 1
+        if should_close_tab:
+            try:
+                page.close(run_before_unload=False)
+            except Exception:
+                pass
@@ -34,7 +34,8 @@ DEFAULT_CONFIG = {
     },
     "chrome": {
         "debug_port": 9222,
-        "debug_host": "127.0.0.1"
+        "debug_host": "127.0.0.1",
+        "max_tabs": 2  # Concurrent CDP tabs across all parallel source searches
     }
 }
 
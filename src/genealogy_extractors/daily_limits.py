@@ -0,0 +1,56 @@
+"""
+Daily Limits - Remembers which sources hit their daily search limit today
+
+Persisted to ~/.genealogy-extractors/daily_limits.json so later runs on the
+same day skip a limited source without spending a browser round-trip on it.
+Entries expire at local midnight.
+"""
+
+import json
+from datetime import date
+from threading import Lock
+from typing import Dict, Optional
+
+from .config import CONFIG_DIR, _ensure_config_dir
+from .debug_log import warn
+
+
+DAILY_LIMITS_FILE = CONFIG_DIR / "daily_limits.json"
+
+_limits: Optional[Dict[str, str]] = None  # source_key -> ISO date the limit was hit
+_lock = Lock()
+
+
+def _load() -> Dict[str, str]:
+    """Load limits from disk once per process (caller holds _lock)"""
+    global _limits
+    if _limits is None:
+        try:
+            with open(DAILY_LIMITS_FILE, "r") as f:
+                _limits = json.load(f)
+        except (OSError, ValueError):
+            _limits = {}
+    return _limits
+
+
+def daily_limit_reached(source_key: str) -> bool:
+    """True if source_key hit its daily limit earlier today"""
+    with _lock:
+        return _load().get(source_key) == date.today().isoformat()
+
+
+def mark_daily_limit(source_key: str):
+    """Record that source_key hit its daily limit today"""
+    with _lock:
+        limits = _load()
+        today = date.today().isoformat()
+        # Drop entries from previous days while we're rewriting the file
+        for key in [k for k, day in limits.items() if day != today]:
+            del limits[key]
+        limits[source_key] = today
+        try:
+            _ensure_config_dir()
+            with open(DAILY_LIMITS_FILE, "w") as f:
+                json.dump(limits, f, indent=2)
+        except OSError as e:
+            warn("DAILY LIMITS", f"Could not save {DAILY_LIMITS_FILE}: {e}")
@@ -7,10 +7,13 @@ Usage:
 All output follows these patterns:
     debug(source, msg)  -> [SOURCE] message (only in verbose mode)
     info(msg)           -> message (always shown)
+    info_block(lines)   -> several messages in one write (always shown)
     warn(source, msg)   -> [SOURCE] ⚠️  message
     error(source, msg)  -> [SOURCE] ❌ message
 """
 
+import sys
+
 _verbose = False
 
 
@@ -36,6 +39,18 @@ def info(message: str):
     print(message)
 
 
+def info_block(lines):
+    """Print several info lines with a single encoded write (always shown)."""
+    block = '\n'.join(lines) + '\n'
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(block)
+        return
+    # Flush pending print() output first so lines stay in order
+    sys.stdout.flush()
+    buffer.write(block.encode(sys.stdout.encoding or 'utf-8', 'replace'))
+
+
 def warn(source: str, message: str):
     """Print warning message. Format: [SOURCE] ⚠️  message"""
     print(f"[{source}] ⚠️  {message}")
@@ -2,24 +2,56 @@
 Error Tracker - Logs and tracks errors for later analysis
 
 Tracks errors by source, type, and frequency to identify patterns
-and prioritize fixes.
+and prioritize fixes. Errors are recorded in memory immediately and written
+to disk in batches by a background thread, so logging never waits on I/O.
 """
 
+import atexit
 import json
 import os
+import re
+import time
 from datetime import datetime
-from threading import Lock
+from threading import Condition, Lock, Thread
 from typing import Dict, List, Optional
 
 
+# Exception message markers -> error type, in priority order (first listed wins)
+ERROR_PATTERNS = (
+    ('429', 'RATE_LIMIT'),
+    ('rate limit', 'RATE_LIMIT'),
+    ('timeout', 'TIMEOUT'),
+    ('navigation', 'NAVIGATION'),
+    ('404', 'NOT_FOUND'),
+)
+_ERROR_RE = re.compile('|'.join(re.escape(marker) for marker, _ in ERROR_PATTERNS), re.IGNORECASE)
+
+
+def classify_error(message: str) -> str:
+    """Map an exception message to an error type using ERROR_PATTERNS
+
+    Finds every marker in one regex pass, then picks the highest-priority type.
+    """
+    found = {m.lower() for m in _ERROR_RE.findall(message)}
+    return next((error_type for marker, error_type in ERROR_PATTERNS if marker in found), 'UNKNOWN')
+
+
 class ErrorTracker:
     """Thread-safe error tracking with persistence"""
-    
+
+    # Write once this many errors are pending, or FLUSH_INTERVAL seconds after the first
+    FLUSH_BATCH = 50
+    FLUSH_INTERVAL = 1.0
+
     def __init__(self, log_file: str = "error_log.json"):
         self.log_file = log_file
         self.lock = Lock()
         self.errors: List[Dict] = []
         self.error_counts: Dict[str, int] = {}
+        self._pending = 0
+        self._pending_changed = Condition(self.lock)
+        self._writer: Optional[Thread] = None
+        self._save_lock = Lock()  # Serializes file writes; always taken before self.lock
         self._load_existing()
     
     def _load_existing(self):
@@ -60,16 +92,46 @@ class ErrorTracker:
             # Keep only last 1000 errors
             if len(self.errors) > 1000:
                 self.errors = self.errors[-1000:]
-            
-            self._save()
-    
-    def _save(self):
-        """Persist error log to disk"""
+
+            # Hand the disk write to the background writer
+            self._pending += 1
+            if self._writer is None:
+                self._writer = Thread(target=self._write_loop, name="error-tracker", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+            self._pending_changed.notify()
+
+    def _write_loop(self):
+        """Background writer: batch pending errors into one save"""
+        while True:
+            with self.lock:
+                while not self._pending:
+                    self._pending_changed.wait()
+                deadline = time.monotonic() + self.FLUSH_INTERVAL
+                while self._pending < self.FLUSH_BATCH:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_changed.wait(remaining)
+            self.flush()
+
+    def flush(self):
+        """Write any pending errors to disk now"""
+        with self._save_lock:
+            with self.lock:
+                if not self._pending:
+                    return
+                self._pending = 0
+                errors, counts = list(self.errors), dict(self.error_counts)
+            self._save(errors, counts)
+
+    def _save(self, errors: List[Dict], counts: Dict[str, int]):
+        """Persist error log to disk (caller holds _save_lock)"""
         try:
             with open(self.log_file, 'w') as f:
                 json.dump({
-                    'errors': self.errors,
-                    'counts': self.error_counts,
+                    'errors': errors,
+                    'counts': counts,
                     'last_updated': datetime.now().isoformat()
                 }, f, indent=2)
         except Exception as e:
@@ -109,10 +171,12 @@ class ErrorTracker:
     
     def clear(self):
         """Clear all errors"""
-        with self.lock:
-            self.errors = []
-            self.error_counts = {}
-            self._save()
+        with self._save_lock:
+            with self.lock:
+                self.errors = []
+                self.error_counts = {}
+                self._pending = 0
+            self._save([], {})
 
 
 # Global error tracker instance
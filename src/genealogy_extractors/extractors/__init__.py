@@ -1,23 +1,47 @@
-"""Genealogy record extractors for various online sources."""
+"""Genealogy record extractors for various online sources.
+
+Extractor classes are imported lazily on first attribute access, so loading
+one source doesn't pull in every extractor module.
+"""
+
+from importlib import import_module
 
 from .base import BaseRecordExtractor
-from .ancestry import AncestryExtractor
-from .anom import ANOMExtractor
-from .antenati import AntenatiExtractor
-from .billiongraves import BillionGravesExtractor
-from .digitalarkivet import DigitalarkivetExtractor
-from .familysearch import FamilySearchExtractor
-from .filae import FilaeExtractor
-from .findagrave import FindAGraveExtractor
-from .freebmd import FreeBMDExtractor
-from .geneanet import GeneanetExtractor
-from .geni import GeniExtractor
-from .irishgenealogy import IrishGenealogyExtractor
-from .matchid import MatchIDExtractor
-from .matricula import MatriculaExtractor
-from .myheritage import MyHeritageExtractor
-from .scotlandspeople import ScotlandsPeopleExtractor
-from .wikitree import WikiTreeExtractor
+
+# Extractor class name -> submodule that defines it
+_EXTRACTOR_MODULES = {
+    "AncestryExtractor": ".ancestry",
+    "ANOMExtractor": ".anom",
+    "AntenatiExtractor": ".antenati",
+    "BillionGravesExtractor": ".billiongraves",
+    "DigitalarkivetExtractor": ".digitalarkivet",
+    "FamilySearchExtractor": ".familysearch",
+    "FilaeExtractor": ".filae",
+    "FindAGraveExtractor": ".findagrave",
+    "FreeBMDExtractor": ".freebmd",
+    "GeneanetExtractor": ".geneanet",
+    "GeniExtractor": ".geni",
+    "IrishGenealogyExtractor": ".irishgenealogy",
+    "MatchIDExtractor": ".matchid",
+    "MatriculaExtractor": ".matricula",
+    "MyHeritageExtractor": ".myheritage",
+    "ScotlandsPeopleExtractor": ".scotlandspeople",
+    "WikiTreeExtractor": ".wikitree",
+}
+
+
+def __getattr__(name):
+    module = _EXTRACTOR_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(import_module(module, __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXTRACTOR_MODULES))
+
 
 __all__ = [
     "BaseRecordExtractor",
@@ -4,9 +4,36 @@ Parses Ancestry.com search results (requires subscription)
 """
 
 import re
+from itertools import islice
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from .base import HTML_PARSER, LexborHTMLParser, BaseRecordExtractor, SearchTerms
+
+
+# Patterns applied to every result card
+NAME_NOISE_RE = re.compile(r'\[.*?\]|<.*?>|\?\?')  # user corrections, alternate surnames, unknowns
+WHITESPACE_RE = re.compile(r'\s+')
+FULL_DATE_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+YEAR_RE = re.compile(r'(\d{4})')
+PLACE_AFTER_YEAR_RE = re.compile(r'\d{4}\s+(.+)')
+
+# Only result cards are built into the BeautifulSoup tree
+CARD_STRAINER = SoupStrainer('div', class_='global-results-card')
+
+
+def _joined_text(node) -> str:
+    """selectolax equivalent of BeautifulSoup's get_text(' ', strip=True)
+
+    Node.text(separator=' ', strip=True) keeps whitespace-only text nodes,
+    which would leave doubled spaces in place names.
+    """
+    return ' '.join(
+        text for text in (
+            child.text_content.strip()
+            for child in node.traverse(include_text=True)
+            if child.tag == '-text'
+        ) if text
+    )
 
 
 class AncestryExtractor(BaseRecordExtractor):
@@ -29,73 +56,122 @@ class AncestryExtractor(BaseRecordExtractor):
 
         NOTE: Ancestry requires subscription and structure changes frequently
         """
-        soup = BeautifulSoup(content, 'html.parser')
-        records = []
+        # Find actual result cards, not UI elements (selectolax when installed,
+        # BeautifulSoup otherwise)
+        if LexborHTMLParser is not None:
+            result_cards = LexborHTMLParser(content).css('div.global-results-card')
+            card_fields = self._card_fields_lexbor
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER, parse_only=CARD_STRAINER)
+            result_cards = soup.find_all('div', class_='global-results-card')
+            card_fields = self._card_fields_bs4
 
-        # Find actual result cards (not UI elements)
-        result_cards = soup.find_all('div', class_='global-results-card')
+        records = []
 
         self.debug(f"Found {len(result_cards)} result cards in Ancestry HTML")
 
-        for card in result_cards[:20]:
+        terms = self.prepare_search_params(search_params)
+
+        for card in islice(result_cards, 20):
+            # Cards without a data table or a name come back as None; the
+            # handlers are only for markup or params we don't expect
             try:
-                record = self._extract_person(card, search_params)
-                if record:
-                    records.append(record)
-            except Exception as e:
+                record = self._extract_person(card_fields(card), terms)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
                 self.debug(f"Failed to extract person: {e}")
                 continue
+            except Exception as e:
+                self.warn(f"Unexpected error extracting person: {e}")
+                continue
+
+            if record:
+                records.append(record)
 
         return records
     
-    def _extract_person(self, card, search_params: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract data from a single Ancestry result card
-
-        Ancestry table fields may include:
-        - Name, Birth, Death, Marriage, Residence
-        - Mother, Father (for baptism records)
-        - Baptism (date and place)
-        """
-
+    def _card_fields_bs4(self, card) -> tuple:
+        """Return (url, collection_name, {th: td}) for a BeautifulSoup card"""
         # Find the data table
         table = card.find('table', class_='tableHorizontal')
         if not table:
             return None
 
-        # Extract URL from the title link
+        # Extract URL and collection name from the title link
         title_link = card.find('a', class_='global-results-title-link')
         url = ''
         collection_name = ''
         if title_link:
             url = title_link.get('href', '')
-            if url and not url.startswith('http'):
-                url = f"https://www.ancestry.com{url}"
-            # Get collection name from link text
             collection_name = title_link.get_text(strip=True)
 
-        # Parse table rows
+        # Parse table rows (rendered pages wrap them in <tbody>, so search for them).
+        # Cells are direct children of the row - one pass over those instead of
+        # two recursive finds per row
         data = {}
         for row in table.find_all('tr'):
-            th = row.find('th')
-            td = row.find('td')
+            th = td = None
+            for cell in row.children:
+                if cell.name == 'th':
+                    th = th or cell
+                elif cell.name == 'td':
+                    td = td or cell
+                if th and td:
+                    break
             if th and td:
-                key = th.get_text(strip=True).lower()
-                # Use separator to preserve spaces between elements
-                value = td.get_text(' ', strip=True)
-                data[key] = value
+                # Most cells hold a single text node; otherwise join with a
+                # separator to preserve spaces between elements
+                text = td.string
+                if type(text) is NavigableString:
+                    value = text.strip()
+                else:
+                    value = td.get_text(' ', strip=True)
+                data[th.get_text(strip=True).lower()] = value
 
-        # Extract name - clean up properly
-        name = data.get('name', '')
+        return url, collection_name, data
+
+    def _card_fields_lexbor(self, card) -> tuple:
+        """Return (url, collection_name, {th: td}) for a selectolax card"""
+        table = card.css_first('table.tableHorizontal')
+        if table is None:
+            return None
 
-        # Remove user corrections in brackets first
-        name = re.sub(r'\[.*?\]', '', name).strip()
+        title_link = card.css_first('a.global-results-title-link')
+        url = ''
+        collection_name = ''
+        if title_link is not None:
+            url = title_link.attributes.get('href') or ''
+            collection_name = title_link.text(strip=True)
+
+        data = {}
+        for row in table.css('tr'):
+            th = row.css_first('th')
+            td = row.css_first('td')
+            if th is not None and td is not None:
+                data[th.text(strip=True).lower()] = _joined_text(td)
+
+        return url, collection_name, data
+
+    def _extract_person(self, card_fields: tuple, terms: SearchTerms) -> Dict[str, Any]:
+        """Extract data from a single Ancestry result card
 
-        # Remove angle brackets (alternate surnames)
-        name = re.sub(r'<.*?>', '', name).strip()
+        Ancestry table fields may include:
+        - Name, Birth, Death, Marriage, Residence
+        - Mother, Father (for baptism records)
+        - Baptism (date and place)
+        """
+        if not card_fields:
+            return None
+
+        url, collection_name, data = card_fields
+        if url and not url.startswith('http'):
+            url = f"https://www.ancestry.com{url}"
+
+        # Extract name - clean up properly
+        name = data.get('name', '')
 
-        # Clean up special characters and normalize whitespace
-        name = name.replace('??', '').strip()
-        name = re.sub(r'\s+', ' ', name)
+        # Remove user corrections in brackets, angle-bracketed alternate surnames
+        # and '??' markers in one pass, then normalize whitespace
+        name = WHITESPACE_RE.sub(' ', NAME_NOISE_RE.sub('', name)).strip()
 
         # Extract birth info
         birth_year = None
@@ -105,15 +181,15 @@ class AncestryExtractor(BaseRecordExtractor):
         if birth_text:
             # Format: "27 Dec 1850 Illinois, USA" or "Dec 1850 Illinois" or "1850 Illinois"
             # Try full date first
-            full_date_match = re.search(r'(\d{1,2}\s+\w+\s+\d{4})', birth_text)
+            full_date_match = FULL_DATE_RE.search(birth_text)
             if full_date_match:
                 birth_date = full_date_match.group(1)
 
-            year_match = re.search(r'(\d{4})', birth_text)
+            year_match = YEAR_RE.search(birth_text)
             if year_match:
                 birth_year = int(year_match.group(1))
                 # Extract location after the year
-                after_year = birth_text[birth_text.find(str(birth_year)) + 4:].strip()
+                after_year = birth_text[year_match.end():].strip()
                 if after_year:
                     birth_place = after_year
 
@@ -122,10 +198,10 @@ class AncestryExtractor(BaseRecordExtractor):
         death_place = None
         death_text = data.get('death', '')
         if death_text:
-            death_match = re.search(r'(\d{4})', death_text)
+            death_match = YEAR_RE.search(death_text)
             if death_match:
                 death_year = int(death_match.group(1))
-                after_year = death_text[death_text.find(str(death_year)) + 4:].strip()
+                after_year = death_text[death_match.end():].strip()
                 if after_year:
                     death_place = after_year
 
@@ -133,26 +209,27 @@ class AncestryExtractor(BaseRecordExtractor):
         marriage_year = None
         marriage_text = data.get('marriage', '')
         if marriage_text:
-            marriage_match = re.search(r'(\d{4})', marriage_text)
+            marriage_match = YEAR_RE.search(marriage_text)
             if marriage_match:
                 marriage_year = int(marriage_match.group(1))
 
-        # Extract parents
-        father = data.get('father', '').strip() or None
-        mother = data.get('mother', '').strip() or None
+        # Extract parents (cell text is already stripped)
+        father = data.get('father') or None
+        mother = data.get('mother') or None
 
         # Extract baptism info (may have date/place if no birth)
         baptism_text = data.get('baptism', '')
         if baptism_text and not birth_year:
             # Try to extract year from baptism if no birth year
-            baptism_match = re.search(r'(\d{4})', baptism_text)
+            baptism_match = YEAR_RE.search(baptism_text)
             if baptism_match:
                 birth_year = int(baptism_match.group(1))
-            if not birth_place:
-                # Extract location from baptism
-                place_match = re.search(r'\d{4}\s+(.+)', baptism_text)
-                if place_match:
-                    birth_place = place_match.group(1).strip()
+                if not birth_place:
+                    # Extract location from baptism - no year-and-place run can
+                    # start before the first 4-digit run, so resume from there
+                    place_match = PLACE_AFTER_YEAR_RE.search(baptism_text, baptism_match.start())
+                    if place_match:
+                        birth_place = place_match.group(1).strip()
 
         if not name:
             return None
@@ -177,6 +254,6 @@ class AncestryExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
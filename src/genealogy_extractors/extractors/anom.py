@@ -13,13 +13,46 @@ Coverage:
 import re
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote, urlencode
-from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# Result row markers
+MILITARY_ROW_CLASS_RE = re.compile(r'(pair|impair)')
+BAGNE_ROW_CLASS_RE = re.compile(r'type-notice')
+ARK_HREF_RE = re.compile(r'/ark:/')
+
+# Only result rows of either database are built into the BeautifulSoup tree
+ROW_STRAINER = SoupStrainer('tr', class_=re.compile(r'type-notice|pair|impair'))
+
+# Field patterns applied to every row
+OSD_CLEF_RE = re.compile(r"osd\.php\?clef=([^'\"]+)")
+BIRTH_DATE_RE = re.compile(r'Date de naissance\s*:\s*(\d{4})-(\d{2})-(\d{2})')
+BIRTH_DEPT_RE = re.compile(r'territoire de naissance\s*:\s*(.+)')
+ARK_ID_RE = re.compile(r'ark:/61561/(\d+)')
+YEAR_RE = re.compile(r'(\d{4})')
+DEATH_RE = re.compile(r'Décédé[e]?\s+le\s+(\d{1,2}\s+\w+\s+(\d{4}))')
+
+
+def _cell_text(elem) -> str:
+    """get_text(strip=True), reading the text directly when elem holds a single string"""
+    text = elem.string
+    if type(text) is NavigableString:
+        return text.strip()
+    return elem.get_text(strip=True)
 
 
 class ANOMExtractor(BaseRecordExtractor):
     """Extract records from ANOM search results (Bagne and Military databases)"""
 
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+réponses?',
+        r'\d+\s+résultats?',
+        r'ark:/61561/',
+        r'type-notice',
+        r'inventaires?',
+    ))
+
     BASE_URL = "https://recherche-anom.culture.gouv.fr"
     MILITARY_URL = "http://anom.archivesnationales.culture.gouv.fr/regmatmil"
 
@@ -39,33 +72,36 @@ class ANOMExtractor(BaseRecordExtractor):
         Automatically detects database type (Bagne vs Military) and extracts accordingly.
         """
         records = []
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=ROW_STRAINER)
+
+        terms = self.prepare_search_params(search_params)
 
         # Detect which database we're parsing
         # Note: Check bagne FIRST because bagne pages may contain "Registres matricules" text
         # The military site uses anom.archivesnationales.culture.gouv.fr/regmatmil
         # The bagne site uses recherche-anom.culture.gouv.fr with basebagne
-        if 'type-notice-basebagne' in content or 'basebagne' in content:
-            records = self._extract_bagne_records(soup, content, search_params)
+        # ('type-notice-basebagne' row classes contain the same marker)
+        if 'basebagne' in content:
+            records = self._extract_bagne_records(soup, content, terms)
         elif 'anom.archivesnationales.culture.gouv.fr/regmatmil' in content:
-            records = self._extract_military_records(soup, search_params)
+            records = self._extract_military_records(soup, terms)
         else:
             # Try bagne first, then military
-            records = self._extract_bagne_records(soup, content, search_params)
+            records = self._extract_bagne_records(soup, content, terms)
             if not records:
-                records = self._extract_military_records(soup, search_params)
+                records = self._extract_military_records(soup, terms)
 
         if not records:
             self.debug(f"No records extracted - returning empty list (NO_MATCH)")
 
         return records
 
-    def _extract_military_records(self, soup: BeautifulSoup, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_military_records(self, soup: BeautifulSoup, terms: SearchTerms) -> List[Dict[str, Any]]:
         """Extract records from Military Matricules search results"""
         records = []
 
         # Find result table rows (have onclick handlers)
-        result_rows = soup.find_all('tr', class_=re.compile(r'(pair|impair)'))
+        result_rows = soup.find_all('tr', class_=MILITARY_ROW_CLASS_RE)
         result_rows = [r for r in result_rows if r.get('onclick')]
 
         if not result_rows:
@@ -75,7 +111,7 @@ class ANOMExtractor(BaseRecordExtractor):
 
         for row in result_rows[:50]:  # Limit to top 50
             try:
-                record = self._extract_military_row(row, search_params)
+                record = self._extract_military_row(row, terms)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -84,13 +120,13 @@ class ANOMExtractor(BaseRecordExtractor):
 
         return records
 
-    def _extract_military_row(self, row, search_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_military_row(self, row, terms: SearchTerms) -> Optional[Dict[str, Any]]:
         """Extract data from a military matricule result row"""
         # Get onclick URL for detail page
         onclick = row.get('onclick', '')
         detail_url = None
         if 'osd.php?clef=' in onclick:
-            match = re.search(r"osd\.php\?clef=([^'\"]+)", onclick)
+            match = OSD_CLEF_RE.search(onclick)
             if match:
                 detail_url = f"{self.MILITARY_URL}/osd.php?clef={match.group(1)}"
 
@@ -102,27 +138,27 @@ class ANOMExtractor(BaseRecordExtractor):
         birth_dept = None
 
         # Parse title: "Date de naissance : 1860-02-20\nDépartement / territoire de naissance : Alger"
-        birth_match = re.search(r'Date de naissance\s*:\s*(\d{4})-(\d{2})-(\d{2})', title)
+        birth_match = BIRTH_DATE_RE.search(title)
         if birth_match:
             birth_year = int(birth_match.group(1))
             birth_date = f"{birth_match.group(1)}-{birth_match.group(2)}-{birth_match.group(3)}"
 
-        dept_match = re.search(r'territoire de naissance\s*:\s*(.+)', title)
+        dept_match = BIRTH_DEPT_RE.search(title)
         if dept_match:
             birth_dept = dept_match.group(1).strip()
 
-        # Extract cells
-        cells = row.find_all('td')
+        # Extract cells - only the row's own cells, and only as many as we read
+        cells = row.find_all('td', recursive=False, limit=8)
         if len(cells) < 6:
             return None
 
         # Cells: [number, access_icon, nom, prenoms, classe, matricule, territoire, bureau]
-        surname = cells[2].get_text(strip=True) if len(cells) > 2 else None
-        given_names = cells[3].get_text(strip=True) if len(cells) > 3 else None
-        classe = cells[4].get_text(strip=True) if len(cells) > 4 else None
-        matricule = cells[5].get_text(strip=True) if len(cells) > 5 else None
-        territoire = cells[6].get_text(strip=True) if len(cells) > 6 else None
-        bureau = cells[7].get_text(strip=True) if len(cells) > 7 else None
+        surname = _cell_text(cells[2]) if len(cells) > 2 else None
+        given_names = _cell_text(cells[3]) if len(cells) > 3 else None
+        classe = _cell_text(cells[4]) if len(cells) > 4 else None
+        matricule = _cell_text(cells[5]) if len(cells) > 5 else None
+        territoire = _cell_text(cells[6]) if len(cells) > 6 else None
+        bureau = _cell_text(cells[7]) if len(cells) > 7 else None
 
         if not surname:
             return None
@@ -151,56 +187,63 @@ class ANOMExtractor(BaseRecordExtractor):
             'note': 'Detail page contains scanned image with parent names, address, profession'
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
     def _extract_bagne_records(self, soup: BeautifulSoup, content: str,
-                                search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+                                terms: SearchTerms) -> List[Dict[str, Any]]:
         """Extract records from Bagne (penal colony) search results"""
         records = []
 
         # Find result rows - classes are ['arc_impair', 'type-notice-basebagne']
         # BeautifulSoup matches regex against each class individually
-        result_rows = soup.find_all('tr', class_=re.compile(r'type-notice'))
+        result_rows = soup.find_all('tr', class_=BAGNE_ROW_CLASS_RE)
 
         if result_rows:
             self.debug(f"Found {len(result_rows)} bagne result rows")
             for row in result_rows[:30]:
                 try:
-                    record = self._extract_bagne_row(row, search_params)
+                    record = self._extract_bagne_row(row, terms)
                     if record:
                         records.append(record)
                 except Exception as e:
                     self.debug(f"Failed to extract bagne row: {e}")
                     continue
         else:
-            # Fallback: look for ARK IDs
-            ark_ids = re.findall(r'ark:/61561/(\d+)', content)
-            if ark_ids:
-                self.debug(f"Found {len(set(ark_ids))} ARK IDs in text")
-                for ark_id in list(set(ark_ids))[:20]:
-                    record = self._extract_from_text(content, ark_id, search_params)
-                    if record:
-                        records.append(record)
+            # Fallback: look for ARK IDs - the first 20 distinct ones in page
+            # order, without collecting every match on the page first
+            seen = set()
+            for ark_match in ARK_ID_RE.finditer(content):
+                ark_id = ark_match.group(1)
+                if ark_id in seen:
+                    continue
+                seen.add(ark_id)
+                record = self._extract_from_text(content, ark_id, terms)
+                if record:
+                    records.append(record)
+                if len(seen) >= 20:
+                    break
+            if seen:
+                self.debug(f"Used {len(seen)} ARK IDs from text")
 
         return records
     
-    def _extract_bagne_row(self, row, search_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_bagne_row(self, row, terms: SearchTerms) -> Optional[Dict[str, Any]]:
         """Extract data from a Bagne result row"""
         # Extract name from unittitle
         name_elem = row.find('span', class_='unittitle')
-        name = name_elem.get_text(strip=True) if name_elem else None
+        name = _cell_text(name_elem) if name_elem else None
 
         if not name:
             return None
 
         # Extract ARK identifier and build URL
-        ark_link = row.find('a', href=re.compile(r'/ark:/'))
+        ark_link = row.find('a', href=ARK_HREF_RE)
         ark_id = None
         url = None
         if ark_link:
             href = ark_link.get('href')
-            ark_match = re.search(r'ark:/61561/(\d+)', href)
+            ark_match = ARK_ID_RE.search(href)
             if ark_match:
                 ark_id = ark_match.group(1)
                 url = f"{self.BASE_URL}/ark:/61561/{ark_id}"
@@ -217,20 +260,19 @@ class ANOMExtractor(BaseRecordExtractor):
                 if p_elem:
                     fields[key] = p_elem.get_text(strip=True)
                 else:
-                    # For items without <p>, extract text nodes after the label
-                    # Get all text from item, then strip the key pattern from start
-                    full_text = item.get_text(strip=True)
-                    # Remove key pattern "Key :" or "Key\xa0:" from start
-                    for pattern in [f"{key}\xa0:", f"{key} :", f"{key}:"]:
-                        if full_text.startswith(pattern):
-                            full_text = full_text[len(pattern):]
-                            break
-                    fields[key] = full_text.strip()
+                    # For items without <p>, the value is the text after the label
+                    # (read from the label's siblings, so the label text isn't
+                    # rebuilt and stripped back off)
+                    fields[key] = ''.join(
+                        node.get_text(strip=True) if isinstance(node, Tag) else node.strip()
+                        for node in label.next_siblings
+                        if isinstance(node, Tag) or type(node) is NavigableString
+                    ).lstrip(' \xa0:').strip()
 
         # Extract condemnation year
         condemnation_year = None
         if 'Condamné en' in fields:
-            year_match = re.search(r'(\d{4})', fields['Condamné en'])
+            year_match = YEAR_RE.search(fields['Condamné en'])
             if year_match:
                 condemnation_year = int(year_match.group(1))
 
@@ -238,7 +280,7 @@ class ANOMExtractor(BaseRecordExtractor):
         death_year = None
         death_date = None
         observations = fields.get('Observations complémentaires', '')
-        death_match = re.search(r'Décédé[e]?\s+le\s+(\d{1,2}\s+\w+\s+(\d{4}))', observations)
+        death_match = DEATH_RE.search(observations)
         if death_match:
             death_date = death_match.group(1)
             death_year = int(death_match.group(2))
@@ -272,22 +314,31 @@ class ANOMExtractor(BaseRecordExtractor):
             'raw_data': fields
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
     def _extract_from_text(self, content: str, ark_id: str,
-                           search_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                           terms: SearchTerms) -> Optional[Dict[str, Any]]:
         """Extract basic record from text when HTML parsing fails"""
         url = f"{self.BASE_URL}/ark:/61561/{ark_id}"
 
         # Look for name near ARK ID
-        context_start = max(0, content.find(ark_id) - 500)
-        context_end = min(len(content), content.find(ark_id) + 500)
-        context = content[context_start:context_end]
-
-        # Try to find name pattern
-        name_match = re.search(r'unittitle["\']?>([^<]+)<', context)
-        name = name_match.group(1).strip() if name_match else None
+        ark_pos = content.find(ark_id)
+        context_start = max(0, ark_pos - 500)
+        context_end = min(len(content), ark_pos + 500)
+
+        # Find the first unittitle"> or unittitle> tag end and take the text up to the next tag
+        name = None
+        idx = content.find('unittitle', context_start, context_end)
+        while idx >= 0 and name is None:
+            gt = idx + len('unittitle')
+            if content[gt:gt + 1] in ('"', "'"):
+                gt += 1
+            if content[gt:gt + 1] == '>':
+                lt = content.find('<', gt + 1, context_end)
+                if lt > gt + 1:
+                    name = content[gt + 1:lt].strip()
+            idx = content.find('unittitle', idx + 1, context_end)
 
         if not name:
             return None
@@ -299,25 +350,9 @@ class ANOMExtractor(BaseRecordExtractor):
             'source': self.source_name,
             'database': 'bagne'
         }
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if ANOM page has results"""
-        indicators = [
-            r'\d+\s+réponses?',
-            r'\d+\s+résultats?',
-            r'ark:/61561/',
-            r'type-notice',
-            r'inventaires?'
-        ]
-
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-
-        return False
-
     @staticmethod
     def build_bagne_search_url(surname: str = None, given_name: str = None,
                                 year_start: int = None, year_end: int = None,
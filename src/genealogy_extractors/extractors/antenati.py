@@ -9,13 +9,34 @@ NOTE: Antenati has two search types:
 
 import re
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from bs4 import BeautifulSoup, SoupStrainer
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# Only person items are built into the BeautifulSoup tree
+ITEM_STRAINER = SoupStrainer('div', class_='search-item')
+
+# Relationship labels in nominative-links (Italian and English), matched in
+# one pass over each label, and the family key each one fills
+FAMILY_ROLE_RE = re.compile(r'padre|father|madre|mother|coniuge|spouse|figlio|figlia|child')
+FAMILY_ROLE_KEYS = {
+    'padre': 'father', 'father': 'father',
+    'madre': 'mother', 'mother': 'mother',
+    'coniuge': 'spouse', 'spouse': 'spouse',
+    'figlio': 'children', 'figlia': 'children', 'child': 'children',
+}
 
 
 class AntenatiExtractor(BaseRecordExtractor):
     """Extract individual person records from Antenati nominative search results"""
 
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+risultati',
+        r'\d+\s+records?',
+        r'registry',
+        r'antenati.cultura.gov.it',
+    ))
+
     def __init__(self):
         super().__init__("Antenati")
     
@@ -37,7 +58,7 @@ class AntenatiExtractor(BaseRecordExtractor):
           </div>
         </div>
         """
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=ITEM_STRAINER)
         records = []
 
         # Find all person items (nominative search uses div.search-item)
@@ -45,9 +66,11 @@ class AntenatiExtractor(BaseRecordExtractor):
 
         self.debug(f"Found {len(person_items)} people in Antenati nominative search")
 
+        terms = self.prepare_search_params(search_params)
+
         for item in person_items[:20]:  # Top 20 results
             try:
-                record = self._extract_person(item, search_params)
+                record = self._extract_person(item, search_params, terms)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -56,7 +79,8 @@ class AntenatiExtractor(BaseRecordExtractor):
 
         return records
     
-    def _extract_person(self, element, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_person(self, element, search_params: Dict[str, Any],
+                        terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a single Antenati person record
 
         Actual HTML structure (2024):
@@ -135,18 +159,15 @@ class AntenatiExtractor(BaseRecordExtractor):
                 h4 = li.find('h4')
                 a = li.find('a')
                 if h4 and a:
-                    role = h4.get_text(strip=True).lower()
+                    role_match = FAMILY_ROLE_RE.search(h4.get_text(strip=True).lower())
+                    if not role_match:
+                        continue
                     person_name = a.get_text(strip=True)
-                    if 'padre' in role or 'father' in role:
-                        family['father'] = person_name
-                    elif 'madre' in role or 'mother' in role:
-                        family['mother'] = person_name
-                    elif 'coniuge' in role or 'spouse' in role:
-                        family['spouse'] = person_name
-                    elif 'figlio' in role or 'figlia' in role or 'child' in role:
-                        if 'children' not in family:
-                            family['children'] = []
-                        family['children'].append(person_name)
+                    key = FAMILY_ROLE_KEYS[role_match.group()]
+                    if key == 'children':
+                        family.setdefault('children', []).append(person_name)
+                    else:
+                        family[key] = person_name
 
         # Use search params as fallback
         if not birth_place:
@@ -164,21 +185,5 @@ class AntenatiExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
-    
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if Antenati page has results"""
-        indicators = [
-            r'\d+\s+risultati',
-            r'\d+\s+records?',
-            'registry',
-            'antenati.cultura.gov.it'
-        ]
-        
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
-
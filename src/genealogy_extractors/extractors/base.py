@@ -4,15 +4,120 @@ Abstract base class for all source-specific extractors
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import List, Dict, Any, NamedTuple, Optional
 import re
 
 from ..debug_log import debug as _debug, warn as _warn, error as _error, is_verbose
 
 
+# BeautifulSoup tree builder for HTML extractors: lxml's C parser when available
+# (a declared dependency), the pure-Python stdlib parser otherwise
+HTML_PARSER = 'lxml' if find_spec('lxml') is not None else 'html.parser'
+
+try:
+    # Optional fast path for the busiest extractors: lexbor-backed parser
+    # (pip install genealogy-extractors[fast]); None means use BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional C++ edit distance (same [fast] extra); None means the Python DP below
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein
+except ImportError:
+    _RFLevenshtein = None
+
+
+# Birth year proximity buckets: (max year difference, points), checked in order.
+# Differences beyond the last bucket are penalized.
+_BIRTH_YEAR_BUCKETS = ((0, 20), (2, 15), (5, 10), (10, 5), (20, 0))
+_BIRTH_YEAR_MISMATCH_PENALTY = -10
+
+
+def birth_year_points(search_year: int, record_year: int) -> int:
+    """Score how close a record's birth year is to the searched year.
+
+    Kept free of dict/record access so it can be applied to plain year
+    values pulled out of a whole page of records.
+    """
+    diff = abs(search_year - record_year)
+    for max_diff, points in _BIRTH_YEAR_BUCKETS:
+        if diff <= max_diff:
+            return points
+    return _BIRTH_YEAR_MISMATCH_PENALTY
+
+
+@lru_cache(maxsize=4096)
+def levenshtein_ratio(s1: str, s2: str, min_ratio: float = 0.0) -> float:
+    """Calculate Levenshtein similarity ratio (0.0 to 1.0)
+
+    Cached: a page of records is scored against the same search terms, and
+    surnames and places repeat across records and sources.
+
+    Callers that only need to know whether the ratio is above min_ratio can
+    pass it: ratios that aren't come back as 0.0, which lets the distance
+    calculation stop as soon as the ratio can no longer get above it.
+    """
+    if not s1 or not s2:
+        return 0.0
+    if s1 == s2:
+        return 1.0
+    if _RFLevenshtein is not None:
+        # Same ratio: 1 - distance / max(len1, len2)
+        return _RFLevenshtein.normalized_similarity(s1, s2, score_cutoff=min_ratio)
+
+    # Simple Levenshtein distance
+    len1, len2 = len(s1), len(s2)
+    if len1 < len2:
+        s1, s2 = s2, s1
+        len1, len2 = len2, len1
+    max_len = len1
+
+    # The distance is at least the length difference
+    if 1.0 - ((len1 - len2) / max_len) <= min_ratio:
+        return 0.0
+
+    # Use only two rows of the matrix
+    prev_row = list(range(len2 + 1))
+    for i, c1 in enumerate(s1):
+        curr_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = prev_row[j + 1] + 1
+            deletions = curr_row[j] + 1
+            substitutions = prev_row[j] + (c1 != c2)
+            curr_row.append(min(insertions, deletions, substitutions))
+        # Row minimums never decrease, so each one bounds the final distance
+        if min_ratio and 1.0 - (min(curr_row) / max_len) <= min_ratio:
+            return 0.0
+        prev_row = curr_row
+
+    distance = prev_row[len2]
+    return 1.0 - (distance / max_len)
+
+
+class SearchTerms(NamedTuple):
+    """Search parameters pre-normalized for match scoring (see prepare_search_params)"""
+    surname: str
+    given: str
+    year: Any
+    location: str
+
+
 class BaseRecordExtractor(ABC):
     """Abstract base class for record extraction from search results"""
 
+    # Signs that a page has results (see _has_results_indicator). Searched one
+    # at a time: on a page with no match that beats a single alternation
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+results?',
+        r'\d+\s+résultats?',
+        r'\d+\s+risultati',
+        r'search results',
+        r'showing results',
+    ))
+
     def __init__(self, source_name: str):
         self.source_name = source_name
 
@@ -78,22 +183,10 @@ class BaseRecordExtractor(ABC):
     def _has_results_indicator(self, content: str) -> bool:
         """Check if page content indicates results are present
         
-        Override this in subclasses to detect source-specific result indicators
+        Subclasses set RESULT_INDICATOR_RES to their source-specific patterns,
+        or override this for checks that are not plain pattern searches
         """
-        # Generic check for common result indicators
-        indicators = [
-            r'\d+\s+results?',
-            r'\d+\s+résultats?',
-            r'\d+\s+risultati',
-            'search results',
-            'showing results'
-        ]
-        
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
+        return any(pattern.search(content) for pattern in self.RESULT_INDICATOR_RES)
     
     def _create_fallback_record(self, url: str, error_type: str) -> List[Dict[str, Any]]:
         """Create fallback record when parser fails"""
@@ -111,6 +204,20 @@ class BaseRecordExtractor(ABC):
         """Log parser failure for maintenance tracking"""
         self.warn(f"PARSER FAILURE: {message}")
     
+    def prepare_search_params(self, search_params: Dict[str, Any]) -> SearchTerms:
+        """Normalize search params once so scoring a page of records doesn't redo it
+
+        The result can be passed to calculate_match_score in place of search_params.
+        """
+        if isinstance(search_params, SearchTerms):
+            return search_params
+        return SearchTerms(
+            surname=(search_params.get('surname') or '').lower(),
+            given=(search_params.get('given_name') or '').lower(),
+            year=search_params.get('birth_year') or search_params.get('year_min'),
+            location=(search_params.get('location') or '').lower(),
+        )
+
     def calculate_match_score(self, record: Dict[str, Any], search_params: Dict[str, Any]) -> int:
         """Calculate match confidence score (0-100)
 
@@ -122,27 +229,28 @@ class BaseRecordExtractor(ABC):
 
         Args:
             record: Extracted record data
-            search_params: Original search parameters
+            search_params: Original search parameters, or SearchTerms from prepare_search_params
 
         Returns:
             Match score 0-100
         """
+        terms = self.prepare_search_params(search_params)
         score = 50  # Start neutral - we found something
 
         name = (record.get('name') or '').lower()
 
         # SURNAME MATCH (most important) - up to +25
-        surname = (search_params.get('surname') or '').lower()
+        surname = terms.surname
         if surname and name:
             if surname in name:
                 score += 25  # Exact substring match
-            elif self._levenshtein_ratio(surname, self._extract_surname(name)) > 0.8:
+            elif self._levenshtein_ratio(surname, self._extract_surname(name), 0.8) > 0.8:
                 score += 15  # Close fuzzy match
-            elif self._levenshtein_ratio(surname, name) > 0.5:
+            elif self._levenshtein_ratio(surname, name, 0.5) > 0.5:
                 score += 5   # Partial match
 
         # GIVEN NAME MATCH - up to +15
-        given = (search_params.get('given_name') or '').lower()
+        given = terms.given
         if given and name:
             if given in name:
                 score += 15  # Exact match
@@ -151,32 +259,22 @@ class BaseRecordExtractor(ABC):
                 name_parts = name.split()
                 if name_parts and given[0] == name_parts[0][0]:
                     score += 10  # Initial matches
-                elif self._levenshtein_ratio(given, name) > 0.7:
+                elif self._levenshtein_ratio(given, name, 0.7) > 0.7:
                     score += 10  # Close fuzzy match
 
         # BIRTH YEAR MATCH - up to +20
-        search_year = search_params.get('birth_year') or search_params.get('year_min')
+        search_year = terms.year
         record_year = record.get('birth_year')
         if search_year and record_year:
-            diff = abs(int(search_year) - int(record_year))
-            if diff == 0:
-                score += 20
-            elif diff <= 2:
-                score += 15
-            elif diff <= 5:
-                score += 10
-            elif diff <= 10:
-                score += 5
-            elif diff > 20:
-                score -= 10  # Penalize large year differences
+            score += birth_year_points(int(search_year), int(record_year))
 
         # LOCATION MATCH (bonus only, no penalty for missing) - up to +10
-        search_loc = (search_params.get('location') or '').lower()
+        search_loc = terms.location
         record_loc = (record.get('birth_place') or '').lower()
         if search_loc and record_loc:
             if search_loc in record_loc or record_loc in search_loc:
                 score += 10
-            elif self._levenshtein_ratio(search_loc, record_loc) > 0.6:
+            elif self._levenshtein_ratio(search_loc, record_loc, 0.6) > 0.6:
                 score += 5
 
         # BONUS for rich data - up to +10
@@ -204,31 +302,6 @@ class BaseRecordExtractor(ABC):
         # Default to last word
         return parts[-1] if parts else ''
 
-    def _levenshtein_ratio(self, s1: str, s2: str) -> float:
-        """Calculate Levenshtein similarity ratio (0.0 to 1.0)"""
-        if not s1 or not s2:
-            return 0.0
-        if s1 == s2:
-            return 1.0
-
-        # Simple Levenshtein distance
-        len1, len2 = len(s1), len(s2)
-        if len1 < len2:
-            s1, s2 = s2, s1
-            len1, len2 = len2, len1
-
-        # Use only two rows of the matrix
-        prev_row = list(range(len2 + 1))
-        for i, c1 in enumerate(s1):
-            curr_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = prev_row[j + 1] + 1
-                deletions = curr_row[j] + 1
-                substitutions = prev_row[j] + (c1 != c2)
-                curr_row.append(min(insertions, deletions, substitutions))
-            prev_row = curr_row
-
-        distance = prev_row[len2]
-        max_len = max(len1, len2)
-        return 1.0 - (distance / max_len)
-
+    def _levenshtein_ratio(self, s1: str, s2: str, min_ratio: float = 0.0) -> float:
+        """Calculate Levenshtein similarity ratio (0.0 to 1.0), 0.0 if not above min_ratio"""
+        return levenshtein_ratio(s1, s2, min_ratio)
@@ -7,7 +7,33 @@ Similar to Find A Grave but different HTML structure
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# Result containers, tried in order (class names vary between page versions)
+CARD_CLASS_RE = re.compile(r'result|record|grave-card')
+LINK_CLASS_RE = re.compile(r'result|record|grave')
+ROW_CLASS_RE = re.compile(r'result|record')
+GRAVE_HREF_RE = re.compile(r'/grave/(\d+)')
+YEAR_RE = re.compile(r'\b(1[5-9]\d{2}|20[0-2]\d)\b')
+
+# No-results messages, checked as plain substrings of the lowercased page
+NO_RESULTS_MARKERS = (
+    'no results found',
+    'no records found',
+    'no graves found',
+    '0 results',
+    'did not find any',
+    'no matches',
+)
+
+# Error page messages, checked as plain substrings of the lowercased page
+ERROR_PAGE_MARKERS = (
+    'error 404',
+    'page not found',
+    'something went wrong',
+    'server error',
+)
 
 
 class BillionGravesExtractor(BaseRecordExtractor):
@@ -18,33 +44,36 @@ class BillionGravesExtractor(BaseRecordExtractor):
 
     def extract_records(self, content: str, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract grave records from BillionGraves content"""
+        terms = self.prepare_search_params(search_params)
+
         records = []
 
-        # Check for no results
-        if self._is_no_results(content):
+        # Check for no results and error pages before parsing, on one
+        # lowercased copy of the page
+        content_lower = content.lower()
+        if self._is_no_results(content_lower):
             self.debug(f"BillionGraves: No results page detected")
             return []
 
-        # Check for error page
-        if self._is_error_page(content):
+        if self._is_error_page(content_lower):
             self.debug(f"BillionGraves: Error page detected")
             return []
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         # BillionGraves uses divs with class containing 'record' or 'result'
         # Look for result cards/rows
         result_items = (
-            soup.find_all('div', class_=re.compile(r'result|record|grave-card')) or
-            soup.find_all('a', class_=re.compile(r'result|record|grave')) or
-            soup.find_all('tr', class_=re.compile(r'result|record'))
+            soup.find_all('div', class_=CARD_CLASS_RE) or
+            soup.find_all('a', class_=LINK_CLASS_RE) or
+            soup.find_all('tr', class_=ROW_CLASS_RE)
         )
 
         if result_items:
             self.debug(f"BillionGraves: Found {len(result_items)} result items")
             for item in result_items[:20]:
                 try:
-                    record = self._extract_record(item, search_params)
+                    record = self._extract_record(item, terms)
                     if record:
                         records.append(record)
                 except Exception as e:
@@ -52,23 +81,23 @@ class BillionGravesExtractor(BaseRecordExtractor):
                     continue
         else:
             # Fallback: look for grave links
-            grave_links = soup.find_all('a', href=re.compile(r'/grave/\d+'))
+            grave_links = soup.find_all('a', href=GRAVE_HREF_RE)
             if grave_links:
                 self.debug(f"BillionGraves: Found {len(grave_links)} grave links")
                 for link in grave_links[:20]:
-                    record = self._extract_from_link(link, search_params)
+                    record = self._extract_from_link(link, terms)
                     if record:
                         records.append(record)
 
         return records
 
-    def _extract_record(self, item, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_record(self, item, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a result item"""
         # Get text content
         text = item.get_text(' ', strip=True)
 
         # Find link to grave page
-        link = item.find('a', href=re.compile(r'/grave/\d+'))
+        link = item.find('a', href=GRAVE_HREF_RE)
         if not link:
             link = item if item.name == 'a' and item.get('href') else None
 
@@ -80,7 +109,7 @@ class BillionGravesExtractor(BaseRecordExtractor):
                 url = f"https://billiongraves.com{href}"
             else:
                 url = href
-            grave_match = re.search(r'/grave/(\d+)', href)
+            grave_match = GRAVE_HREF_RE.search(href)
             grave_id = grave_match.group(1) if grave_match else None
 
         # Extract name (usually in h2, h3, or strong)
@@ -90,7 +119,7 @@ class BillionGravesExtractor(BaseRecordExtractor):
             name = link.get_text(strip=True)
 
         # Extract years
-        year_matches = re.findall(r'\b(1[5-9]\d{2}|20[0-2]\d)\b', text)
+        year_matches = YEAR_RE.findall(text)
         birth_year = int(year_matches[0]) if year_matches else None
         death_year = int(year_matches[1]) if len(year_matches) > 1 else None
 
@@ -119,10 +148,10 @@ class BillionGravesExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _extract_from_link(self, link, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_link(self, link, terms: SearchTerms) -> Dict[str, Any]:
         """Extract basic info from a grave link"""
         href = link.get('href', '')
         name = link.get_text(strip=True)
@@ -136,30 +165,14 @@ class BillionGravesExtractor(BaseRecordExtractor):
             'url': url,
             'source': self.source_name
         }
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _is_no_results(self, content: str) -> bool:
-        """Check for no results indicators"""
-        no_result_patterns = [
-            r'no results found',
-            r'no records found',
-            r'no graves found',
-            r'0 results',
-            r'did not find any',
-            r'no matches'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in no_result_patterns)
-
-    def _is_error_page(self, content: str) -> bool:
-        """Check for error page indicators"""
-        error_patterns = [
-            r'error 404',
-            r'page not found',
-            r'something went wrong',
-            r'server error'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in error_patterns)
+    def _is_no_results(self, content_lower: str) -> bool:
+        """Check the lowercased page for no results indicators"""
+        return any(marker in content_lower for marker in NO_RESULTS_MARKERS)
+
+    def _is_error_page(self, content_lower: str) -> bool:
+        """Check the lowercased page for error page indicators"""
+        return any(marker in content_lower for marker in ERROR_PAGE_MARKERS)
 
@@ -6,7 +6,31 @@ Free Norwegian archives - church records, census, emigration
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# Result containers, tried in order (class names vary between page versions)
+ROW_CLASS_RE = re.compile(r'result|record|hit')
+DIV_CLASS_RE = re.compile(r'result|record|hit|person')
+PERSON_HREF_RE = re.compile(r'/(person|kilde|source)/')
+YEAR_RE = re.compile(r'\b(1[5-9]\d{2}|20[0-2]\d)\b')
+
+# No-results messages, checked as plain substrings of the lowercased page
+NO_RESULTS_MARKERS = (
+    'ingen treff',  # Norwegian for "no hits"
+    'no results',
+    '0 treff',
+    'fant ingen',  # "found none"
+    'no records found',
+)
+
+# Error page messages, checked as plain substrings of the lowercased page
+ERROR_PAGE_MARKERS = (
+    'error 404',
+    'page not found',
+    'siden finnes ikke',  # "page does not exist"
+    'server error',
+)
 
 
 class DigitalarkivetExtractor(BaseRecordExtractor):
@@ -17,32 +41,35 @@ class DigitalarkivetExtractor(BaseRecordExtractor):
 
     def extract_records(self, content: str, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract records from Digitalarkivet search results"""
+        terms = self.prepare_search_params(search_params)
+
         records = []
 
-        # Check for no results
-        if self._is_no_results(content):
+        # Check for no results and error pages before parsing, on one
+        # lowercased copy of the page
+        content_lower = content.lower()
+        if self._is_no_results(content_lower):
             self.debug(f"Digitalarkivet: No results page detected")
             return []
 
-        # Check for error page
-        if self._is_error_page(content):
+        if self._is_error_page(content_lower):
             self.debug(f"Digitalarkivet: Error page detected")
             return []
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         # Look for result rows in table or list format
         result_rows = (
-            soup.find_all('tr', class_=re.compile(r'result|record|hit')) or
-            soup.find_all('div', class_=re.compile(r'result|record|hit|person')) or
-            soup.find_all('li', class_=re.compile(r'result|record|hit'))
+            soup.find_all('tr', class_=ROW_CLASS_RE) or
+            soup.find_all('div', class_=DIV_CLASS_RE) or
+            soup.find_all('li', class_=ROW_CLASS_RE)
         )
 
         if result_rows:
             self.debug(f"Digitalarkivet: Found {len(result_rows)} result rows")
             for row in result_rows[:20]:
                 try:
-                    record = self._extract_record(row, search_params)
+                    record = self._extract_record(row, terms)
                     if record:
                         records.append(record)
                 except Exception as e:
@@ -50,22 +77,22 @@ class DigitalarkivetExtractor(BaseRecordExtractor):
                     continue
         else:
             # Fallback: look for links to person/source pages
-            person_links = soup.find_all('a', href=re.compile(r'/(person|kilde|source)/'))
+            person_links = soup.find_all('a', href=PERSON_HREF_RE)
             if person_links:
                 self.debug(f"Digitalarkivet: Found {len(person_links)} person links")
                 for link in person_links[:20]:
-                    record = self._extract_from_link(link, search_params)
+                    record = self._extract_from_link(link, terms)
                     if record:
                         records.append(record)
 
         return records
 
-    def _extract_record(self, row, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_record(self, row, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a result row"""
         text = row.get_text(' ', strip=True)
 
         # Find link to person/source page
-        link = row.find('a', href=re.compile(r'/(person|kilde|source)/'))
+        link = row.find('a', href=PERSON_HREF_RE)
         url = None
         if link:
             href = link.get('href', '')
@@ -83,7 +110,7 @@ class DigitalarkivetExtractor(BaseRecordExtractor):
             name = link.get_text(strip=True)
 
         # Extract years
-        year_matches = re.findall(r'\b(1[5-9]\d{2}|20[0-2]\d)\b', text)
+        year_matches = YEAR_RE.findall(text)
         birth_year = int(year_matches[0]) if year_matches else None
         death_year = int(year_matches[1]) if len(year_matches) > 1 else None
 
@@ -122,10 +149,10 @@ class DigitalarkivetExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _extract_from_link(self, link, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_link(self, link, terms: SearchTerms) -> Dict[str, Any]:
         """Extract basic info from a person link"""
         href = link.get('href', '')
         name = link.get_text(strip=True)
@@ -139,29 +166,14 @@ class DigitalarkivetExtractor(BaseRecordExtractor):
             'url': url,
             'source': self.source_name
         }
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _is_no_results(self, content: str) -> bool:
-        """Check for no results indicators"""
-        patterns = [
-            r'ingen treff',  # Norwegian for "no hits"
-            r'no results',
-            r'0 treff',
-            r'fant ingen',  # "found none"
-            r'no records found'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
-
-    def _is_error_page(self, content: str) -> bool:
-        """Check for error page indicators"""
-        patterns = [
-            r'error 404',
-            r'page not found',
-            r'siden finnes ikke',  # "page does not exist"
-            r'server error'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
+    def _is_no_results(self, content_lower: str) -> bool:
+        """Check the lowercased page for no results indicators"""
+        return any(marker in content_lower for marker in NO_RESULTS_MARKERS)
+
+    def _is_error_page(self, content_lower: str) -> bool:
+        """Check the lowercased page for error page indicators"""
+        return any(marker in content_lower for marker in ERROR_PAGE_MARKERS)
 
@@ -5,13 +5,25 @@ Parses FamilySearch search results (requires login)
 
 import re
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from bs4 import BeautifulSoup, SoupStrainer
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# Result rows carry the record's ARK in data-testid; only those are built into
+# the BeautifulSoup tree
+ARK_TESTID_RE = re.compile(r'/ark:/')
+ROW_STRAINER = SoupStrainer('tr', attrs={'data-testid': ARK_TESTID_RE})
 
 
 class FamilySearchExtractor(BaseRecordExtractor):
     """Extract records from FamilySearch search results"""
-    
+
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+results?',
+        r'/ark:/',
+        r'search results',
+    ))
+
     def __init__(self):
         super().__init__("FamilySearch")
     
@@ -34,17 +46,19 @@ class FamilySearchExtractor(BaseRecordExtractor):
           </td>
         </tr>
         """
-        soup = BeautifulSoup(content, 'html.parser')
+        terms = self.prepare_search_params(search_params)
+
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=ROW_STRAINER)
         records = []
 
         # Find all result rows with ark IDs
-        person_rows = soup.find_all('tr', attrs={'data-testid': re.compile(r'/ark:/')})
+        person_rows = soup.find_all('tr', attrs={'data-testid': ARK_TESTID_RE})
 
         self.debug(f"Found {len(person_rows)} person rows in FamilySearch HTML")
 
         for row in person_rows[:20]:
             try:
-                record = self._extract_person(row, search_params)
+                record = self._extract_person(row, terms)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -53,7 +67,7 @@ class FamilySearchExtractor(BaseRecordExtractor):
 
         return records
     
-    def _extract_person(self, row, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_person(self, row, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a single FamilySearch result row
 
         FamilySearch can have multiple columns with different event types:
@@ -260,7 +274,7 @@ class FamilySearchExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
     def _extract_event_data(self, cell) -> tuple:
@@ -370,18 +384,3 @@ class FamilySearchExtractor(BaseRecordExtractor):
             return 'male'
         else:
             return 'unknown'
-
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if FamilySearch page has results"""
-        indicators = [
-            r'\d+\s+results?',
-            '/ark:/',
-            'search results'
-        ]
-
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
-
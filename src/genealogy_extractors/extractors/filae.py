@@ -6,7 +6,7 @@ Parses Filae.com French genealogy records
 import re
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
 
 
 class FilaeExtractor(BaseRecordExtractor):
@@ -22,7 +22,9 @@ class FilaeExtractor(BaseRecordExtractor):
         - Results in <div class="result-item"> or similar containers
         - Each result has name, dates, location, document type
         """
-        soup = BeautifulSoup(content, 'html.parser')
+        terms = self.prepare_search_params(search_params)
+
+        soup = BeautifulSoup(content, HTML_PARSER)
         records = []
         
         # Try multiple selectors - Filae may use different structures
@@ -37,7 +39,7 @@ class FilaeExtractor(BaseRecordExtractor):
         
         for item in result_items[:20]:
             try:
-                record = self._extract_person(item, search_params)
+                record = self._extract_person(item, terms)
                 if record and record.get('name'):
                     records.append(record)
             except Exception as e:
@@ -46,7 +48,7 @@ class FilaeExtractor(BaseRecordExtractor):
         
         return records
     
-    def _extract_person(self, item, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_person(self, item, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a single Filae result
 
         Filae 2024 structure (data-testid="PersonCard"):
@@ -227,12 +229,12 @@ class FilaeExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
     
     def _has_results_indicator(self, content: str) -> bool:
         """Check if Filae page has results"""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
         
         # Check for result count or result items
         result_count = soup.find(class_=re.compile(r'result.*count|nombre.*result', re.I))
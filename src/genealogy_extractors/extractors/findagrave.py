@@ -6,12 +6,19 @@ Parses Find A Grave search results and extracts individual memorial records
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
 
 
 class FindAGraveExtractor(BaseRecordExtractor):
     """Extract records from Find A Grave search results"""
-    
+
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+memorials?',
+        r'\d+\s+results?',
+        r'memorial/',
+        r'search results',
+    ))
+
     def __init__(self):
         super().__init__("Find A Grave")
     
@@ -21,17 +28,19 @@ class FindAGraveExtractor(BaseRecordExtractor):
         Works with both full HTML and partial content.
         If no memorial items found, returns empty list (which signals NO_MATCH).
         """
+        terms = self.prepare_search_params(search_params)
+
         records = []
 
         # Try parsing as HTML first
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
         memorial_items = soup.find_all('div', class_='memorial-item')
 
         if memorial_items:
             self.debug(f"Found {len(memorial_items)} memorial items in HTML")
             for item in memorial_items[:20]:  # Limit to top 20
                 try:
-                    record = self._extract_memorial_from_html(item, search_params)
+                    record = self._extract_memorial_from_html(item, terms)
                     if record:
                         records.append(record)
                 except Exception as e:
@@ -45,7 +54,7 @@ class FindAGraveExtractor(BaseRecordExtractor):
                 self.debug(f"Found {len(memorial_ids)} memorial IDs in text")
                 # Extract basic info from text around each memorial ID
                 for memorial_id in memorial_ids[:20]:
-                    record = self._extract_from_text(content, memorial_id, search_params)
+                    record = self._extract_from_text(content, memorial_id, terms)
                     if record:
                         records.append(record)
 
@@ -54,7 +63,7 @@ class FindAGraveExtractor(BaseRecordExtractor):
 
         return records
 
-    def _extract_memorial_from_html(self, item, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_memorial_from_html(self, item, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a memorial-item div"""
         # Extract memorial URL and ID
         link = item.find('a', href=re.compile(r'/memorial/\d+'))
@@ -163,10 +172,10 @@ class FindAGraveExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _extract_from_text(self, content: str, memorial_id: str, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_text(self, content: str, memorial_id: str, terms: SearchTerms) -> Dict[str, Any]:
         """Extract basic record info from text when HTML parsing fails"""
         # Build basic record with memorial ID
         url = f"https://www.findagrave.com/memorial/{memorial_id}"
@@ -202,7 +211,7 @@ class FindAGraveExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
     def _extract_record_from_lines(self, lines: List[str], start_idx: int, search_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -303,22 +312,6 @@ class FindAGraveExtractor(BaseRecordExtractor):
         record['match_score'] = self.calculate_match_score(record, search_params)
 
         return record
-    
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if Find A Grave page has results"""
-        # Find A Grave specific indicators
-        indicators = [
-            r'\d+\s+memorials?',
-            r'\d+\s+results?',
-            'memorial/',
-            'search results'
-        ]
-        
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
 
 
 # Example usage:
@@ -4,9 +4,18 @@ Parses FreeBMD (UK Birth, Marriage, Death records) search results
 """
 
 import re
+from itertools import islice
 from typing import List, Dict, Any
 from urllib.parse import unquote
-from .base import BaseRecordExtractor
+from .base import BaseRecordExtractor, SearchTerms
+
+
+# The searchData JavaScript array and the quoted entries inside it
+SEARCH_DATA_RE = re.compile(r'var\s+searchData\s*=\s*new\s+Array\s*\((.*?)\);', re.DOTALL)
+ENTRY_RE = re.compile(r'"([^"]*)"')
+
+# Records taken from one results page (a full page holds up to 3000 entries)
+MAX_ENTRIES = 49
 
 
 class FreeBMDExtractor(BaseRecordExtractor):
@@ -26,27 +35,26 @@ class FreeBMDExtractor(BaseRecordExtractor):
         """
         records = []
 
-        # Extract the searchData JavaScript array
-        search_data_match = re.search(
-            r'var\s+searchData\s*=\s*new\s+Array\s*\((.*?)\);',
-            content,
-            re.DOTALL
-        )
+        # Locate the searchData JavaScript array
+        search_data_match = SEARCH_DATA_RE.search(content)
 
         if not search_data_match:
             return []
 
-        # Parse the array entries
-        data_str = search_data_match.group(1)
-
-        # Extract individual entries (quoted strings)
-        entries = re.findall(r'"([^"]*)"', data_str)
+        # Walk the quoted entries in place rather than slicing out the array and
+        # splitting all of it: only the header and the first MAX_ENTRIES are used
+        entries = (
+            m.group(1) for m in ENTRY_RE.finditer(
+                content, search_data_match.start(1), search_data_match.end(1)
+            )
+        )
 
-        if not entries:
+        # First entry is header: " ;quarter;type;year"
+        header_entry = next(entries, None)
+        if header_entry is None:
             return []
 
-        # First entry is header: " ;quarter;type;year"
-        header = entries[0].split(';')
+        header = header_entry.split(';')
         current_year = None
         if len(header) >= 4:
             try:
@@ -54,14 +62,16 @@ class FreeBMDExtractor(BaseRecordExtractor):
             except ValueError:
                 pass
 
+        terms = self.prepare_search_params(search_params)
+
         # Track current surname/given for inherited values
         current_surname = ''
         current_given = ''
 
-        for entry in entries[1:50]:  # Process up to 50 records
+        for entry in islice(entries, MAX_ENTRIES):
             try:
                 record = self._parse_entry(entry, current_surname, current_given,
-                                          current_year, search_params)
+                                          current_year, terms)
                 if record:
                     # Update current values if this entry has them
                     if record['raw_data'].get('surname'):
@@ -75,7 +85,7 @@ class FreeBMDExtractor(BaseRecordExtractor):
         return records
 
     def _parse_entry(self, entry: str, current_surname: str, current_given: str,
-                     year: int, search_params: Dict[str, Any]) -> Dict[str, Any]:
+                     year: int, terms: SearchTerms) -> Dict[str, Any]:
         """Parse a single searchData entry
 
         Format: "type;surname;given;mother;flag;district;volume;page;reference"
@@ -132,7 +142,7 @@ class FreeBMDExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
     def _has_results_indicator(self, content: str) -> bool:
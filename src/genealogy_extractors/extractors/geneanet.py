@@ -7,12 +7,19 @@ Enhanced to capture parents, spouse, marriage date, and image URLs
 import re
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
 
 
 class GeneanetExtractor(BaseRecordExtractor):
     """Extract records from Geneanet search results"""
 
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+\s+résultats?',
+        r'\d+\s+results?',
+        r'/individu/',
+        r'search results',
+    ))
+
     def __init__(self):
         super().__init__("Geneanet")
 
@@ -25,7 +32,9 @@ class GeneanetExtractor(BaseRecordExtractor):
         - Tooltips contain: full dates, parents, marriage info
         - URL pattern: https://gw.geneanet.org/...
         """
-        soup = BeautifulSoup(content, 'html.parser')
+        terms = self.prepare_search_params(search_params)
+
+        soup = BeautifulSoup(content, HTML_PARSER)
         records = []
 
         # Find all result rows (ligne-resultat)
@@ -35,7 +44,7 @@ class GeneanetExtractor(BaseRecordExtractor):
 
         for item in result_items[:20]:  # Limit to first 20 results
             try:
-                record = self._extract_individual(item, soup, search_params)
+                record = self._extract_individual(item, soup, terms)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -44,7 +53,7 @@ class GeneanetExtractor(BaseRecordExtractor):
 
         return records
     
-    def _extract_individual(self, element, soup: BeautifulSoup, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_individual(self, element, soup: BeautifulSoup, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a single Geneanet individual
 
         Structure:
@@ -198,21 +207,5 @@ class GeneanetExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
-    
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if Geneanet page has results"""
-        indicators = [
-            r'\d+\s+résultats?',
-            r'\d+\s+results?',
-            '/individu/',
-            'search results'
-        ]
-        
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
-
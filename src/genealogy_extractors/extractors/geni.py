@@ -9,12 +9,19 @@ Requires logged-in session via CDP browser
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
 
 
 class GeniExtractor(BaseRecordExtractor):
     """Extract records from Geni.com search results (HTML)"""
 
+    RESULT_INDICATOR_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Showing \d+-\d+ of [\d,]+ people',
+        r'\d+-\d+ of \d+ people',
+        r'/people/',
+        r'Search Results',
+    ))
+
     def __init__(self):
         super().__init__("Geni")
 
@@ -27,7 +34,9 @@ class GeniExtractor(BaseRecordExtractor):
         - Location in <div class="small"> before dates
         - Dates in <div class="small quiet"> format "(YYYY - YYYY)"
         """
-        soup = BeautifulSoup(content, 'html.parser')
+        terms = self.prepare_search_params(search_params)
+
+        soup = BeautifulSoup(content, HTML_PARSER)
         records = []
 
         # Find all profile rows in the results table
@@ -37,7 +46,7 @@ class GeniExtractor(BaseRecordExtractor):
 
         for row in profile_rows[:20]:  # Limit to 20 results
             try:
-                record = self._extract_profile_from_row(row, search_params)
+                record = self._extract_profile_from_row(row, terms)
                 if record and record.get('name'):
                     records.append(record)
             except Exception as e:
@@ -47,7 +56,7 @@ class GeniExtractor(BaseRecordExtractor):
         self.debug(f"Geni: Extracted {len(records)} records")
         return records
 
-    def _extract_profile_from_row(self, row, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_profile_from_row(self, row, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a Geni profile table row
 
         Row structure:
@@ -195,21 +204,5 @@ class GeniExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
-
-    def _has_results_indicator(self, content: str) -> bool:
-        """Check if Geni page has results"""
-        indicators = [
-            r'Showing \d+-\d+ of [\d,]+ people',
-            r'\d+-\d+ of \d+ people',
-            r'/people/',
-            'Search Results'
-        ]
-
-        for pattern in indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-
-        return False
-
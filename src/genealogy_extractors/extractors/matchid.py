@@ -16,6 +16,7 @@ Data captured:
 - Match scores
 """
 
+import atexit
 import re
 import requests
 from typing import Any, Dict, List, Optional
@@ -38,6 +39,10 @@ class MatchIDExtractor(BaseRecordExtractor):
         import os
         super().__init__("MatchID")
         self.api_token = api_token or os.environ.get("MATCHID_API_TOKEN") or self.DEFAULT_TOKEN
+        # Reused across searches so keep-alive skips the TCP/TLS handshake;
+        # closed at exit like extract.py's shared API session
+        self.session = requests.Session()
+        atexit.register(self.session.close)
 
     def build_search_url(
         self,
@@ -90,7 +95,7 @@ class MatchIDExtractor(BaseRecordExtractor):
         if self.api_token:
             headers["Authorization"] = f"Bearer {self.api_token}"
 
-        response = requests.get(url, headers=headers, timeout=30)
+        response = self.session.get(url, headers=headers, timeout=30)
         response.raise_for_status()
 
         data = response.json()
@@ -6,7 +6,25 @@ Free Catholic church records from Germany, Austria, Poland, and other regions
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# No-results messages, checked as plain substrings of the lowercased page
+NO_RESULTS_MARKERS = (
+    'keine ergebnisse',  # German
+    'no results',
+    '0 treffer',
+    'nichts gefunden',
+    'no records found',
+)
+
+# Error page messages, checked as plain substrings of the lowercased page
+ERROR_PAGE_MARKERS = (
+    'error 404',
+    'page not found',
+    'seite nicht gefunden',
+    'server error',
+)
 
 
 class MatriculaExtractor(BaseRecordExtractor):
@@ -17,19 +35,22 @@ class MatriculaExtractor(BaseRecordExtractor):
 
     def extract_records(self, content: str, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract records from Matricula search results"""
+        terms = self.prepare_search_params(search_params)
+
         records = []
 
-        # Check for no results
-        if self._is_no_results(content):
+        # Check for no results and error pages before parsing, on one
+        # lowercased copy of the page
+        content_lower = content.lower()
+        if self._is_no_results(content_lower):
             self.debug(f"Matricula: No results page detected")
             return []
 
-        # Check for error page
-        if self._is_error_page(content):
+        if self._is_error_page(content_lower):
             self.debug(f"Matricula: Error page detected")
             return []
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         # Matricula typically shows results in table or list format
         result_items = (
@@ -42,7 +63,7 @@ class MatriculaExtractor(BaseRecordExtractor):
             self.debug(f"Matricula: Found {len(result_items)} result items")
             for item in result_items[:20]:
                 try:
-                    record = self._extract_record(item, search_params)
+                    record = self._extract_record(item, terms)
                     if record:
                         records.append(record)
                 except Exception as e:
@@ -54,13 +75,13 @@ class MatriculaExtractor(BaseRecordExtractor):
             if register_links:
                 self.debug(f"Matricula: Found {len(register_links)} register links")
                 for link in register_links[:20]:
-                    record = self._extract_from_link(link, search_params)
+                    record = self._extract_from_link(link, terms)
                     if record:
                         records.append(record)
 
         return records
 
-    def _extract_record(self, item, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_record(self, item, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a result item"""
         text = item.get_text(' ', strip=True)
 
@@ -119,10 +140,10 @@ class MatriculaExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _extract_from_link(self, link, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_link(self, link, terms: SearchTerms) -> Dict[str, Any]:
         """Extract basic info from a register link"""
         href = link.get('href', '')
         name = link.get_text(strip=True)
@@ -136,24 +157,14 @@ class MatriculaExtractor(BaseRecordExtractor):
             'url': url,
             'source': self.source_name
         }
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _is_no_results(self, content: str) -> bool:
-        """Check for no results indicators"""
-        patterns = [
-            r'keine ergebnisse',  # German
-            r'no results',
-            r'0 treffer',
-            r'nichts gefunden',
-            r'no records found'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
+    def _is_no_results(self, content_lower: str) -> bool:
+        """Check the lowercased page for no results indicators"""
+        return any(marker in content_lower for marker in NO_RESULTS_MARKERS)
 
-    def _is_error_page(self, content: str) -> bool:
-        """Check for error page indicators"""
-        patterns = [r'error 404', r'page not found', r'seite nicht gefunden', r'server error']
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
+    def _is_error_page(self, content_lower: str) -> bool:
+        """Check the lowercased page for error page indicators"""
+        return any(marker in content_lower for marker in ERROR_PAGE_MARKERS)
 
@@ -4,9 +4,10 @@ Parses MyHeritage search results (requires subscription)
 """
 
 import re
+from itertools import islice
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, LexborHTMLParser, BaseRecordExtractor, SearchTerms
 
 
 class MyHeritageExtractor(BaseRecordExtractor):
@@ -31,17 +32,24 @@ class MyHeritageExtractor(BaseRecordExtractor):
 
         NOTE: MyHeritage requires subscription
         """
-        soup = BeautifulSoup(content, 'html.parser')
-        records = []
+        # Find record cards (selectolax when installed, BeautifulSoup otherwise)
+        if LexborHTMLParser is not None:
+            result_items = LexborHTMLParser(content).css('div.record_card')
+            card_fields = self._card_fields_lexbor
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER)
+            result_items = soup.find_all('div', class_='record_card')
+            card_fields = self._card_fields_bs4
 
-        # Find record cards
-        result_items = soup.find_all('div', class_='record_card')
+        records = []
 
         self.debug(f"Found {len(result_items)} result items in MyHeritage HTML")
 
-        for item in result_items[:20]:
+        terms = self.prepare_search_params(search_params)
+
+        for item in islice(result_items, 20):
             try:
-                record = self._extract_person(item, search_params)
+                record = self._extract_person(card_fields(item), terms)
                 if record:
                     records.append(record)
             except Exception as e:
@@ -49,24 +57,62 @@ class MyHeritageExtractor(BaseRecordExtractor):
                 continue
 
         return records
-    
-    def _extract_person(self, element, search_params: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract data from a single MyHeritage result"""
 
-        # Extract name and URL
-        link = element.find('a', class_='record_name')
+    def _card_fields_bs4(self, card) -> tuple:
+        """Return (name, href, collection, [(label, value), ...]) for a BeautifulSoup card"""
+        link = card.find('a', class_='record_name')
         if not link:
             return None
 
-        name = link.get_text(strip=True)
-        url = link.get('href', '')
+        collection_elem = card.find('div', class_='collection_name')
+        fields = []
+        field_list = card.find('ul', class_='results_field_list')
+        if field_list:
+            for item in field_list.find_all('li', class_='fields_list_item'):
+                label_elem = item.find('span', class_='label')
+                value_elem = item.find('span', class_='value')
+                if label_elem and value_elem:
+                    fields.append((label_elem.get_text(strip=True), value_elem.get_text(strip=True)))
+
+        return (
+            link.get_text(strip=True),
+            link.get('href', ''),
+            collection_elem.get_text(strip=True) if collection_elem else None,
+            fields,
+        )
+
+    def _card_fields_lexbor(self, card) -> tuple:
+        """Return (name, href, collection, [(label, value), ...]) for a selectolax card"""
+        link = card.css_first('a.record_name')
+        if link is None:
+            return None
+
+        collection_elem = card.css_first('div.collection_name')
+        fields = []
+        field_list = card.css_first('ul.results_field_list')
+        if field_list is not None:
+            for item in field_list.css('li.fields_list_item'):
+                label_elem = item.css_first('span.label')
+                value_elem = item.css_first('span.value')
+                if label_elem is not None and value_elem is not None:
+                    fields.append((label_elem.text(strip=True), value_elem.text(strip=True)))
+
+        return (
+            link.text(strip=True),
+            link.attributes.get('href') or '',
+            collection_elem.text(strip=True) if collection_elem is not None else None,
+            fields,
+        )
+
+    def _extract_person(self, fields_tuple: tuple, terms: SearchTerms) -> Dict[str, Any]:
+        """Extract data from a single MyHeritage result"""
+        if not fields_tuple:
+            return None
+
+        name, url, collection, fields = fields_tuple
         if url and not url.startswith('http'):
             url = f"https://www.myheritage.com{url}"
 
-        # Extract collection name
-        collection_elem = element.find('div', class_='collection_name')
-        collection = collection_elem.get_text(strip=True) if collection_elem else None
-
         # Initialize data fields
         birth_year = None
         birth_place = None
@@ -84,59 +130,50 @@ class MyHeritageExtractor(BaseRecordExtractor):
         siblings = []
 
         # Parse field list items
-        field_list = element.find('ul', class_='results_field_list')
-        if field_list:
-            for item in field_list.find_all('li', class_='fields_list_item'):
-                label_elem = item.find('span', class_='label')
-                value_elem = item.find('span', class_='value')
-
-                if not label_elem or not value_elem:
-                    continue
-
-                label = label_elem.get_text(strip=True).lower()
-                value = value_elem.get_text(strip=True)
-
-                if 'birth' in label:
-                    # Parse "1874 - Location" or "Apr 3 1874 - Location"
-                    year_match = re.search(r'\b(\d{4})\b', value)
-                    if year_match:
-                        birth_year = int(year_match.group(1))
-                    # Extract full date if present
-                    date_match = re.search(r'([A-Za-z]+\s+\d{1,2}\s+\d{4})', value)
-                    if date_match:
-                        birth_date = date_match.group(1)
-                    # Extract location (after dash)
-                    if ' - ' in value:
-                        birth_place = value.split(' - ', 1)[1].strip()
-
-                elif 'death' in label:
-                    year_match = re.search(r'\b(\d{4})\b', value)
-                    if year_match:
-                        death_year = int(year_match.group(1))
-                    date_match = re.search(r'([A-Za-z]+\s+\d{1,2}\s+\d{4})', value)
-                    if date_match:
-                        death_date = date_match.group(1)
-                    if ' - ' in value:
-                        death_place = value.split(' - ', 1)[1].strip()
-
-                elif 'father' in label:
-                    father = value
-
-                elif 'mother' in label:
-                    mother = value
-
-                elif 'parents' in label:
-                    parents = value
-
-                elif 'wife' in label or 'husband' in label or 'spouse' in label:
-                    spouse = value
-
-                elif 'children' in label or 'son' in label or 'daughter' in label:
-                    # Split by comma for multiple children
-                    children.extend([c.strip() for c in value.split(',')])
-
-                elif 'sibling' in label:
-                    siblings.extend([s.strip() for s in value.split(',')])
+        for label, value in fields:
+            label = label.lower()
+
+            if 'birth' in label:
+                # Parse "1874 - Location" or "Apr 3 1874 - Location"
+                year_match = re.search(r'\b(\d{4})\b', value)
+                if year_match:
+                    birth_year = int(year_match.group(1))
+                # Extract full date if present
+                date_match = re.search(r'([A-Za-z]+\s+\d{1,2}\s+\d{4})', value)
+                if date_match:
+                    birth_date = date_match.group(1)
+                # Extract location (after dash)
+                if ' - ' in value:
+                    birth_place = value.split(' - ', 1)[1].strip()
+
+            elif 'death' in label:
+                year_match = re.search(r'\b(\d{4})\b', value)
+                if year_match:
+                    death_year = int(year_match.group(1))
+                date_match = re.search(r'([A-Za-z]+\s+\d{1,2}\s+\d{4})', value)
+                if date_match:
+                    death_date = date_match.group(1)
+                if ' - ' in value:
+                    death_place = value.split(' - ', 1)[1].strip()
+
+            elif 'father' in label:
+                father = value
+
+            elif 'mother' in label:
+                mother = value
+
+            elif 'parents' in label:
+                parents = value
+
+            elif 'wife' in label or 'husband' in label or 'spouse' in label:
+                spouse = value
+
+            elif 'children' in label or 'son' in label or 'daughter' in label:
+                # Split by comma for multiple children
+                children.extend([c.strip() for c in value.split(',')])
+
+            elif 'sibling' in label:
+                siblings.extend([s.strip() for s in value.split(',')])
 
         record = {
             'name': name,
@@ -159,6 +196,6 @@ class MyHeritageExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
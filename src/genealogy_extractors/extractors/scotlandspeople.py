@@ -7,7 +7,25 @@ Note: Full records require payment, but index is searchable
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from .base import BaseRecordExtractor
+from .base import HTML_PARSER, BaseRecordExtractor, SearchTerms
+
+
+# No-results messages, checked as plain substrings of the lowercased page
+NO_RESULTS_MARKERS = (
+    'no results found',
+    'no records found',
+    '0 results',
+    'no matching records',
+    'your search returned no results',
+)
+
+# Error page messages, checked as plain substrings of the lowercased page
+ERROR_PAGE_MARKERS = (
+    'error 404',
+    'page not found',
+    'server error',
+    'service unavailable',
+)
 
 
 class ScotlandsPeopleExtractor(BaseRecordExtractor):
@@ -18,19 +36,22 @@ class ScotlandsPeopleExtractor(BaseRecordExtractor):
 
     def extract_records(self, content: str, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract records from ScotlandsPeople search results"""
+        terms = self.prepare_search_params(search_params)
+
         records = []
 
-        # Check for no results
-        if self._is_no_results(content):
+        # Check for no results and error pages before parsing, on one
+        # lowercased copy of the page
+        content_lower = content.lower()
+        if self._is_no_results(content_lower):
             self.debug(f"ScotlandsPeople: No results page detected")
             return []
 
-        # Check for error page
-        if self._is_error_page(content):
+        if self._is_error_page(content_lower):
             self.debug(f"ScotlandsPeople: Error page detected")
             return []
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         # ScotlandsPeople uses tables for results
         result_tables = soup.find_all('table', class_=re.compile(r'result|record|search'))
@@ -40,7 +61,7 @@ class ScotlandsPeopleExtractor(BaseRecordExtractor):
                 self.debug(f"ScotlandsPeople: Found {len(rows)} result rows")
                 for row in rows[:20]:
                     try:
-                        record = self._extract_from_table_row(row, search_params)
+                        record = self._extract_from_table_row(row, terms)
                         if record:
                             records.append(record)
                     except Exception as e:
@@ -52,13 +73,13 @@ class ScotlandsPeopleExtractor(BaseRecordExtractor):
             if result_items:
                 self.debug(f"ScotlandsPeople: Found {len(result_items)} result items")
                 for item in result_items[:20]:
-                    record = self._extract_from_div(item, search_params)
+                    record = self._extract_from_div(item, terms)
                     if record:
                         records.append(record)
 
         return records
 
-    def _extract_from_table_row(self, row, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_table_row(self, row, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a table row"""
         cells = row.find_all(['td', 'th'])
         if len(cells) < 2:
@@ -133,10 +154,10 @@ class ScotlandsPeopleExtractor(BaseRecordExtractor):
             'source': self.source_name
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _extract_from_div(self, item, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_from_div(self, item, terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a div/list item"""
         text = item.get_text(' ', strip=True)
         link = item.find('a')
@@ -158,24 +179,14 @@ class ScotlandsPeopleExtractor(BaseRecordExtractor):
             'url': url,
             'source': self.source_name
         }
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
 
-    def _is_no_results(self, content: str) -> bool:
-        """Check for no results indicators"""
-        patterns = [
-            r'no results found',
-            r'no records found',
-            r'0 results',
-            r'no matching records',
-            r'your search returned no results'
-        ]
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
+    def _is_no_results(self, content_lower: str) -> bool:
+        """Check the lowercased page for no results indicators"""
+        return any(marker in content_lower for marker in NO_RESULTS_MARKERS)
 
-    def _is_error_page(self, content: str) -> bool:
-        """Check for error page indicators"""
-        patterns = [r'error 404', r'page not found', r'server error', r'service unavailable']
-        content_lower = content.lower()
-        return any(re.search(p, content_lower) for p in patterns)
+    def _is_error_page(self, content_lower: str) -> bool:
+        """Check the lowercased page for error page indicators"""
+        return any(marker in content_lower for marker in ERROR_PAGE_MARKERS)
 
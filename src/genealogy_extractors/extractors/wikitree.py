@@ -6,7 +6,14 @@ Parses WikiTree API JSON responses
 import json
 import re
 from typing import List, Dict, Any
-from .base import BaseRecordExtractor
+from .base import BaseRecordExtractor, SearchTerms
+
+try:
+    # Optional faster JSON parser (pip install genealogy-extractors[fast]);
+    # its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 class WikiTreeExtractor(BaseRecordExtractor):
@@ -23,8 +30,10 @@ class WikiTreeExtractor(BaseRecordExtractor):
         - Each match has: Id, Name, FirstName, LastName, BirthDate, DeathDate
         - URL pattern: https://www.wikitree.com/wiki/{Name}
         """
+        terms = self.prepare_search_params(search_params)
+
         try:
-            data = json.loads(content)
+            data = json_loads(content)
         except json.JSONDecodeError:
             return []
         
@@ -37,7 +46,7 @@ class WikiTreeExtractor(BaseRecordExtractor):
             
             for match in matches[:20]:  # Top 20 results
                 try:
-                    record = self._extract_person(match, search_params)
+                    record = self._extract_person(match, terms)
                     if record:
                         records.append(record)
                 except Exception:
@@ -45,7 +54,7 @@ class WikiTreeExtractor(BaseRecordExtractor):
         
         return records
     
-    def _extract_person(self, match: Dict[str, Any], search_params: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_person(self, match: Dict[str, Any], terms: SearchTerms) -> Dict[str, Any]:
         """Extract data from a single WikiTree person
 
         WikiTree API fields:
@@ -122,13 +131,13 @@ class WikiTreeExtractor(BaseRecordExtractor):
             }
         }
 
-        record['match_score'] = self.calculate_match_score(record, search_params)
+        record['match_score'] = self.calculate_match_score(record, terms)
         return record
     
     def _has_results_indicator(self, content: str) -> bool:
         """Check if WikiTree API response has results"""
         try:
-            data = json.loads(content)
+            data = json_loads(content)
             if isinstance(data, list) and len(data) > 0:
                 result = data[0]
                 total = result.get('total', 0)
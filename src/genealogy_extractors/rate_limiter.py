@@ -1,6 +1,7 @@
 """
 Rate Limiter Utility
-Provides thread-safe rate limiting with exponential backoff retry
+Provides thread-safe per-source token-bucket rate limiting that backs off on
+429s and recovers after sustained success, with exponential backoff retry
 
 WikiTree API Rate Limits (from Help:App_Policies):
 - 200 requests per minute
@@ -11,42 +12,90 @@ WikiTree API Rate Limits (from Help:App_Policies):
 import time
 from threading import Lock
 from functools import wraps
-import requests
+
+
+class TokenBucket:
+    """Token bucket for one source: bursts of up to `capacity`, refilled at `rate` per second
+
+    Callers reserve a token and sleep outside the lock, so waiting on one source
+    never blocks another.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
 
 
 class RateLimiter:
-    """Thread-safe rate limiter with Retry-After header support
+    """Thread-safe adaptive rate limiter with Retry-After header support
+
+    Each source gets its own token bucket starting at 1/min_delay requests per
+    second. A 429 halves that source's rate; every `increase_after` consecutive
+    successes raise it again by `increase_step`, up to the starting rate.
 
     Default settings are tuned for WikiTree API limits:
     - 200 requests/minute = 1 request per 0.3 seconds
     - We use 1.0s minimum delay for parallel requests to stay safely under limit
     """
 
-    def __init__(self, min_delay: float = 1.0, max_retries: int = 5, backoff_factor: float = 2.0):
+    def __init__(self, min_delay: float = 1.0, max_retries: int = 5, backoff_factor: float = 2.0,
+                 increase_after: int = 50, increase_step: float = 0.1, min_rate: float = 0.05):
         self.min_delay = min_delay
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.max_rate = 1.0 / min_delay
+        self.min_rate = min(min_rate, self.max_rate)
+        self.increase_after = increase_after
+        self.increase_step = increase_step
+        self.buckets = {}  # Per-source token buckets
+        self.successes = {}  # Per-source consecutive successes since last rate change
         self.last_request_time = {}  # Per-source tracking
         self.request_counts = {}  # Per-source request counting
         self.lock = Lock()
 
+    def _bucket(self, source: str) -> TokenBucket:
+        """Get or create the token bucket for a source (caller holds self.lock)"""
+        bucket = self.buckets.get(source)
+        if bucket is None:
+            bucket = self.buckets[source] = TokenBucket(self.max_rate)
+        return bucket
+
     def wait(self, source: str = "default"):
-        """Enforce minimum delay between requests for a source"""
+        """Block until the source's token bucket allows another request"""
         with self.lock:
-            now = time.time()
-            last_time = self.last_request_time.get(source, 0)
-            elapsed = now - last_time
-
-            if elapsed < self.min_delay:
-                wait_time = self.min_delay - elapsed
-                time.sleep(wait_time)
+            wait_time = self._bucket(source).reserve()
+            self.last_request_time[source] = time.time() + wait_time
+            self.request_counts[source] = self.request_counts.get(source, 0) + 1
 
-            self.last_request_time[source] = time.time()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
-            # Track request count
-            if source not in self.request_counts:
-                self.request_counts[source] = 0
-            self.request_counts[source] += 1
+    def record_success(self, source: str = "default"):
+        """Count a successful request; speed the source back up after a run of them"""
+        with self.lock:
+            streak = self.successes.get(source, 0) + 1
+            bucket = self._bucket(source)
+            if streak >= self.increase_after and bucket.rate < self.max_rate:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+                streak = 0
+            self.successes[source] = streak
+
+    def record_throttled(self, source: str = "default"):
+        """Halve the source's request rate after a 429"""
+        with self.lock:
+            bucket = self._bucket(source)
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            self.successes[source] = 0
 
     def retry_with_backoff(self, func, source: str = "default", *args, **kwargs):
         """Execute function with Retry-After header support and exponential backoff
@@ -55,17 +104,24 @@ class RateLimiter:
         1. First checks for Retry-After header and uses that value
         2. Falls back to exponential backoff if no header present
         """
+        # Imported here so loading the module doesn't pull in requests
+        import requests
+
         last_exception = None
 
         for attempt in range(self.max_retries):
             try:
                 self.wait(source)
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                self.record_success(source)
+                return result
             except requests.exceptions.HTTPError as e:
                 last_exception = e
                 response = getattr(e, 'response', None)
 
                 if response is not None and response.status_code == 429:
+                    self.record_throttled(source)
+
                     # Check for Retry-After header
                     retry_after = response.headers.get('Retry-After')
 
@@ -95,6 +151,7 @@ class RateLimiter:
 
                 # Check if it's a rate limit error (non-requests exception)
                 if '429' in error_str or 'too many' in error_str or 'rate limit' in error_str:
+                    self.record_throttled(source)
                     wait_time = self.min_delay * (self.backoff_factor ** (attempt + 1))
                     print(f"[RATE LIMIT] {source}: Attempt {attempt + 1}/{self.max_retries}, "
                           f"waiting {wait_time:.1f}s...")
@@ -112,7 +169,8 @@ class RateLimiter:
         return {
             "source": source,
             "request_count": self.request_counts.get(source, 0),
-            "last_request": self.last_request_time.get(source, 0)
+            "last_request": self.last_request_time.get(source, 0),
+            "rate": self.buckets[source].rate if source in self.buckets else self.max_rate
         }
 
 
@@ -0,0 +1,119 @@
+"""
+Response Cache - On-disk cache of fetched source pages
+
+Stores raw page/API content in SQLite (~/.genealogy-extractors/response_cache.db)
+keyed by source + search parameters, so repeated queries skip the network and
+don't burn daily quota on captcha-sensitive sources. Rows older than
+MAX_STALE_AGE are pruned when the database is opened.
+"""
+
+import hashlib
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Mapping, Optional
+
+from .config import CONFIG_DIR, _ensure_config_dir
+from .debug_log import warn
+
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    content TEXT NOT NULL
+)
+"""
+
+# Default time-to-live for cached responses (seconds)
+DEFAULT_TTL = 86400
+
+# Rows older than this are deleted; until then they serve as stale fallbacks
+# when a bot check blocks a live fetch
+MAX_STALE_AGE = 7 * DEFAULT_TTL
+
+
+def cache_key(source_key: str, params: Mapping[str, Any]) -> str:
+    """Build the cache key for a source query
+
+    Includes every param that changes the fetched page, not just the name and year.
+    """
+    parts = (
+        source_key,
+        params.get('surname') or '',
+        params.get('given_name') or '',
+        params.get('birth_year'),
+        params.get('birth_year_end'),
+        params.get('location') or '',
+        params.get('country') or '',
+        params.get('region') or '',
+    )
+    return hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe SQLite-backed store of fetched content"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            _ensure_config_dir()
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(CREATE_TABLE_SQL)
+            self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (time.time() - MAX_STALE_AGE,)
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, max_age: Optional[float] = DEFAULT_TTL) -> Optional[str]:
+        """Return cached content for key, or None if missing or older than max_age
+
+        Pass max_age=None to accept stale entries.
+        """
+        try:
+            with self.lock:
+                row = self._get_conn().execute(
+                    "SELECT fetched_at, content FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            warn("CACHE", f"Could not read cache: {e}")
+            return None
+
+        if row is None:
+            return None
+        fetched_at, content = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        return content
+
+    def set(self, key: str, content: str, source: str = "") -> None:
+        """Store content for key, replacing any previous entry"""
+        try:
+            with self.lock:
+                conn = self._get_conn()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, source, fetched_at, content) VALUES (?, ?, ?, ?)",
+                    (key, source, time.time(), content)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            warn("CACHE", f"Could not write cache: {e}")
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache instance"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(str(CONFIG_DIR / "response_cache.db"))
+        return _response_cache
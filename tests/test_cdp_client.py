@@ -0,0 +1,64 @@
+"""Tests for the background about:blank tab janitor in cdp_client"""
+
+import json
+import time
+import types
+
+import pytest
+
+from genealogy_extractors import cdp_client
+
+
+class FakeChrome:
+    """Stands in for curl against the Chrome debug port"""
+
+    def __init__(self, tabs):
+        self.tabs = tabs
+        self.closed = []
+
+    def run(self, cmd, **kwargs):
+        url = cmd[-1]
+        if url.endswith('/json'):
+            return types.SimpleNamespace(returncode=0, stdout=json.dumps(self.tabs))
+        tab_id = url.rsplit('/', 1)[1]
+        self.closed.append(tab_id)
+        self.tabs = [t for t in self.tabs if t['id'] != tab_id]
+        return types.SimpleNamespace(returncode=0, stdout='')
+
+
+@pytest.fixture
+def chrome(monkeypatch):
+    fake = FakeChrome([
+        {'id': 'a', 'url': 'about:blank'},
+        {'id': 'b', 'url': 'https://example.com'},
+        {'id': 'c', 'url': 'about:blank'},
+    ])
+    monkeypatch.setattr(cdp_client.subprocess, 'run', fake.run)
+    monkeypatch.setattr(cdp_client, '_janitor_thread', None)
+    monkeypatch.setattr(cdp_client, '_last_cleanup_time', 0)
+    monkeypatch.setattr(cdp_client, '_active_fetches', 0)
+    monkeypatch.setattr(cdp_client, '_janitor_poll', 0.05)
+    monkeypatch.setattr(cdp_client, '_cleanup_interval', 0.2)
+    return fake
+
+
+def test_first_slot_sweeps_before_counting_itself(chrome):
+    with cdp_client.browser_slot():
+        pass
+    assert chrome.closed == ['a', 'c']
+
+
+def test_skipped_sweep_is_retried_after_search(chrome):
+    with cdp_client.browser_slot():
+        chrome.tabs.append({'id': 'd', 'url': 'about:blank'})
+        time.sleep(0.5)
+        # The janitor must leave tabs alone while a search holds a slot
+        assert chrome.closed == ['a', 'c']
+    time.sleep(0.5)
+    assert chrome.closed == ['a', 'c', 'd']
+
+
+def test_all_blank_keeps_one_tab(chrome):
+    chrome.tabs = [{'id': 'a', 'url': 'about:blank'}, {'id': 'b', 'url': 'about:blank'}]
+    assert cdp_client.cleanup_stale_tabs(force=True) == 1
+    assert [t['id'] for t in chrome.tabs] == ['a']
@@ -0,0 +1,93 @@
+"""Tests for the adaptive per-source token-bucket rate limiter"""
+
+import pytest
+import requests
+
+from genealogy_extractors import rate_limiter
+from genealogy_extractors.rate_limiter import RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(rate_limiter.time, 'sleep', slept.append)
+    return slept
+
+
+def _too_many_requests(retry_after=None):
+    response = requests.Response()
+    response.status_code = 429
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return requests.exceptions.HTTPError(response=response)
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=2.0, capacity=1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+
+
+def test_throttle_halves_rate_and_successes_recover_it():
+    limiter = RateLimiter(min_delay=1.0, increase_after=3, increase_step=0.25)
+
+    limiter.record_throttled('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(0.5)
+    limiter.record_throttled('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(0.25)
+
+    for _ in range(3 * 3):
+        limiter.record_success('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(1.0)
+
+    # Never recovers past the starting rate
+    for _ in range(3 * 3):
+        limiter.record_success('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(1.0)
+
+
+def test_throttle_is_per_source_and_bounded():
+    limiter = RateLimiter(min_delay=1.0, min_rate=0.2)
+    for _ in range(10):
+        limiter.record_throttled('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(0.2)
+    assert limiter.get_stats('matchid')['rate'] == pytest.approx(1.0)
+
+
+def test_success_streak_resets_on_throttle():
+    limiter = RateLimiter(min_delay=1.0, increase_after=3, increase_step=0.25)
+    limiter.record_throttled('wikitree')
+    limiter.record_success('wikitree')
+    limiter.record_success('wikitree')
+    limiter.record_throttled('wikitree')
+    limiter.record_success('wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(0.25)
+
+
+def test_retry_on_429_honours_retry_after_and_halves_rate(sleeps):
+    limiter = RateLimiter(min_delay=1.0)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _too_many_requests(retry_after='3')
+        return 'ok'
+
+    assert limiter.retry_with_backoff(fetch, 'wikitree') == 'ok'
+    assert len(calls) == 2
+    assert 3.0 in sleeps
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(0.5)
+
+
+def test_non_429_http_error_is_not_retried(sleeps):
+    limiter = RateLimiter(min_delay=1.0)
+    response = requests.Response()
+    response.status_code = 500
+
+    def fetch():
+        raise requests.exceptions.HTTPError(response=response)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        limiter.retry_with_backoff(fetch, 'wikitree')
+    assert limiter.get_stats('wikitree')['rate'] == pytest.approx(1.0)
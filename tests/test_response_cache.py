@@ -0,0 +1,115 @@
+"""Tests for the on-disk response cache and how extract_from_source uses it"""
+
+import time
+
+import pytest
+
+import extract
+from genealogy_extractors.cdp_client import BotCheckDetected
+from genealogy_extractors.response_cache import MAX_STALE_AGE, ResponseCache, cache_key
+
+
+PARAMS = {'surname': 'Smith', 'given_name': 'John', 'birth_year': 1850}
+
+RESULTS_PAGE = """<html><body>
+<div class="search-result"><h3>John Smith</h3><a href="/grave/John-Smith/123">view</a>
+<span>1850 - 1920</span><p>Springfield, Illinois</p></div>
+</body></html>"""
+
+NO_RESULTS_PAGE = "<html><body><p>No results found for John Smith</p></body></html>"
+ERROR_PAGE = "<html><body><h1>Something went wrong</h1></body></html>"
+
+
+def _age_row(cache, key, age):
+    conn = cache._get_conn()
+    conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time() - age, key))
+    conn.commit()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / 'response_cache.db'))
+    monkeypatch.setattr(extract, 'get_response_cache', lambda: cache)
+    monkeypatch.setattr(extract, 'daily_limit_reached', lambda source_key: False)
+    return cache
+
+
+def _fetch_returning(monkeypatch, content):
+    fetched = []
+
+    def fetch(url, **kwargs):
+        fetched.append(url)
+        return content
+
+    monkeypatch.setattr(extract, 'fetch_page_content', fetch)
+    return fetched
+
+
+def test_cache_key_covers_location_and_year_range():
+    base = cache_key('geneanet', extract.normalize_params(PARAMS))
+    assert base != cache_key('geneanet', extract.normalize_params({**PARAMS, 'location': 'Paris'}))
+    assert base != cache_key('geneanet', extract.normalize_params({**PARAMS, 'birth_year_end': 1851}))
+    assert base != cache_key('findagrave', extract.normalize_params(PARAMS))
+
+
+def test_results_page_is_cached_and_reused(cache, monkeypatch):
+    fetched = _fetch_returning(monkeypatch, RESULTS_PAGE)
+
+    first = extract.extract_from_source('billiongraves', PARAMS)
+    second = extract.extract_from_source('billiongraves', PARAMS)
+
+    assert first['success'] and first['count'] == 1
+    assert second['records'] == first['records']
+    assert len(fetched) == 1
+
+
+@pytest.mark.parametrize('page', [NO_RESULTS_PAGE, ERROR_PAGE])
+def test_error_and_no_results_pages_are_not_cached(cache, monkeypatch, page):
+    fetched = _fetch_returning(monkeypatch, page)
+
+    result = extract.extract_from_source('billiongraves', PARAMS)
+
+    assert result['success'] and result['count'] == 0
+    assert cache.get(cache_key('billiongraves', extract.normalize_params(PARAMS)), max_age=None) is None
+    extract.extract_from_source('billiongraves', PARAMS)
+    assert len(fetched) == 2
+
+
+def test_old_rows_are_pruned_on_open(tmp_path):
+    db_path = str(tmp_path / 'response_cache.db')
+    cache = ResponseCache(db_path)
+    cache.set('old', 'old page')
+    cache.set('recent', 'recent page')
+    _age_row(cache, 'old', MAX_STALE_AGE + 60)
+    _age_row(cache, 'recent', MAX_STALE_AGE - 60)
+
+    reopened = ResponseCache(db_path)
+
+    assert reopened.get('old', max_age=None) is None
+    assert reopened.get('recent', max_age=None) == 'recent page'
+
+
+def test_stale_copy_is_used_on_bot_check(cache, monkeypatch):
+    key = cache_key('billiongraves', extract.normalize_params(PARAMS))
+    cache.set(key, RESULTS_PAGE, source='billiongraves')
+    _age_row(cache, key, extract.SOURCES['billiongraves'].cache_ttl + 60)
+
+    def blocked(url, **kwargs):
+        raise BotCheckDetected("captcha")
+
+    monkeypatch.setattr(extract, 'fetch_page_content', blocked)
+
+    result = extract.extract_from_source('billiongraves', PARAMS)
+
+    assert result['success'] and result['count'] == 1
+
+
+def test_bot_check_without_cached_copy_is_reported(cache, monkeypatch):
+    def blocked(url, **kwargs):
+        raise BotCheckDetected("captcha")
+
+    monkeypatch.setattr(extract, 'fetch_page_content', blocked)
+
+    result = extract.extract_from_source('billiongraves', PARAMS)
+
+    assert not result['success'] and result['bot_check']